@@ -16,7 +16,7 @@ from pathlib import Path
 from typing import Any, Dict, NamedTuple, Set, Tuple
 
 
-ALLOWED_REASON_CODES = {
+ALLOWED_REASON_CODES = frozenset({
     "MISSING_STUDENT_NAME",
     "MISSING_GRADE",
     "MISSING_SCHOOL_NAME",
@@ -31,7 +31,7 @@ ALLOWED_REASON_CODES = {
     "POSSIBLE_FIELD_SWAP",
     "CONTENT_MISMATCH",
     "BLANK_SUBMISSION",
-}
+})
 
 
 POLICY_VERSION = "v1"
@@ -540,9 +540,14 @@ def compute_field_source_pages(
     detailed = compute_field_attribution_confidence(
         per_page_text, extracted_fields, chunk_page_start, chunk_page_end
     )
+    return field_source_pages_from_attribution(detailed)
+
+
+def field_source_pages_from_attribution(attribution: dict) -> dict:
+    """Reduce compute_field_attribution_confidence() output to field -> page_index (or None)."""
     return {
         field: (details or {}).get("page_index")
-        for field, details in detailed.items()
+        for field, details in attribution.items()
     }
 
 
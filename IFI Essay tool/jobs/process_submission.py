@@ -381,10 +381,7 @@ def process_submission_job(
                             "single" if analysis.doc_class == DocClass.BULK_SCANNED_BATCH else analysis.structure
                         ),
                         "analysis_form_layout": analysis.form_layout,
-                        "analysis_header_signature_score_max": max(
-                            (p.header_signature_score for p in analysis.pages),
-                            default=0.0,
-                        ),
+                        "analysis_header_signature_score_max": analysis.header_signature_score_max,
                     },
                     doc_format=analysis.format,
                 )
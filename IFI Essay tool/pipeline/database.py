@@ -7,7 +7,7 @@ import sqlite3
 import json
 import os
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime
 from pipeline.schema import SubmissionRecord
 
@@ -123,6 +123,40 @@ def init_database():
         print(f"Warning: Database initialization error (will retry on first use): {e}")
 
 
+_INSERT_SUBMISSION_SQL = """
+    INSERT OR REPLACE INTO submissions (
+        submission_id, student_name, school_name, grade,
+        teacher_name, city_or_location, father_figure_name,
+        phone, email, word_count, ocr_confidence_avg,
+        needs_review, review_reason_codes, artifact_dir,
+        filename, owner_user_id, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _submission_row(record: SubmissionRecord, filename: str = None, owner_user_id: str = None) -> tuple:
+    """Map a SubmissionRecord to the parameter tuple for _INSERT_SUBMISSION_SQL."""
+    return (
+        record.submission_id,
+        record.student_name,
+        record.school_name,
+        record.grade,
+        record.teacher_name,
+        record.city_or_location,
+        record.father_figure_name,
+        record.phone,
+        record.email,
+        record.word_count,
+        record.ocr_confidence_avg,
+        1 if record.needs_review else 0,
+        record.review_reason_codes,
+        record.artifact_dir,
+        filename,
+        owner_user_id,
+        datetime.now()
+    )
+
+
 def save_record(record: SubmissionRecord, filename: str = None, owner_user_id: str = None) -> bool:
     """
     Save a submission record to the database.
@@ -145,33 +179,7 @@ def save_record(record: SubmissionRecord, filename: str = None, owner_user_id: s
     cursor = conn.cursor()
     
     try:
-        cursor.execute("""
-            INSERT OR REPLACE INTO submissions (
-                submission_id, student_name, school_name, grade,
-                teacher_name, city_or_location, father_figure_name,
-                phone, email, word_count, ocr_confidence_avg,
-                needs_review, review_reason_codes, artifact_dir,
-                filename, owner_user_id, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            record.submission_id,
-            record.student_name,
-            record.school_name,
-            record.grade,
-            record.teacher_name,
-            record.city_or_location,
-            record.father_figure_name,
-            record.phone,
-            record.email,
-            record.word_count,
-            record.ocr_confidence_avg,
-            1 if record.needs_review else 0,
-            record.review_reason_codes,
-            record.artifact_dir,
-            filename,
-            owner_user_id,
-            datetime.now()
-        ))
+        cursor.execute(_INSERT_SUBMISSION_SQL, _submission_row(record, filename, owner_user_id))
         
         conn.commit()
         return True
@@ -183,6 +191,37 @@ def save_record(record: SubmissionRecord, filename: str = None, owner_user_id: s
         conn.close()
 
 
+def save_records_bulk(pairs: List[Tuple[SubmissionRecord, str]], owner_user_id: str = None) -> int:
+    """
+    Save many submission records in a single transaction.
+    
+    Args:
+        pairs: List of (SubmissionRecord, filename) tuples
+        owner_user_id: User ID of the teacher who owns these records (optional)
+        
+    Returns:
+        Number of records saved (0 if the transaction was rolled back)
+    """
+    if not pairs:
+        return 0
+    
+    init_database()
+    
+    db_path = Path(DB_PATH)
+    conn = sqlite3.connect(str(db_path))
+    
+    try:
+        rows = [_submission_row(record, filename, owner_user_id) for record, filename in pairs]
+        with conn:
+            conn.executemany(_INSERT_SUBMISSION_SQL, rows)
+        return len(rows)
+    except Exception as e:
+        print(f"Error saving records to database: {e}")
+        return 0
+    finally:
+        conn.close()
+
+
 def get_records(needs_review: Optional[bool] = None, limit: int = 1000, owner_user_id: str = None) -> List[Dict]:
     """
     Get submission records from the database.
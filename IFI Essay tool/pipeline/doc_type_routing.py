@@ -17,14 +17,19 @@ IFI_ANCHORS = (
 )
 
 
-def detect_pdf_has_acroform_fields(pdf_path: str) -> bool:
+def detect_pdf_has_acroform_fields(pdf_path: str | fitz.Document) -> bool:
     """
     Return True when the PDF appears to contain AcroForm widgets.
+    Accepts a path or an already-open document; a passed-in document is left open.
     """
-    try:
-        doc = fitz.open(pdf_path)
-    except Exception:
-        return False
+    owns_doc = not isinstance(pdf_path, fitz.Document)
+    if owns_doc:
+        try:
+            doc = fitz.open(pdf_path)
+        except Exception:
+            return False
+    else:
+        doc = pdf_path
     try:
         for page in doc:
             try:
@@ -42,10 +47,11 @@ def detect_pdf_has_acroform_fields(pdf_path: str) -> bool:
                 return True
         return False
     finally:
-        try:
-            doc.close()
-        except Exception:
-            pass
+        if owns_doc:
+            try:
+                doc.close()
+            except Exception:
+                pass
 
 
 def _get_analysis_value(analysis: Any, key: str, default=None):
@@ -14,6 +14,7 @@ import os
 import re
 import tempfile
 from dataclasses import dataclass, asdict, field
+from functools import cached_property
 from typing import List, Tuple, Optional
 
 import fitz  # PyMuPDF
@@ -58,6 +59,11 @@ class DocumentAnalysis:
     is_scanned_multi_submission: bool = False  # True when format=image_only, structure=multi, requires OCR for handwritten essays
     doc_class: DocClass = DocClass.SINGLE_TYPED  # Formal classification (assigned before extraction)
 
+    @cached_property
+    def header_signature_score_max(self) -> float:
+        """Highest per-page header signature score (0.0 when there are no pages); computed once."""
+        return max((p.header_signature_score for p in self.pages), default=0.0)
+
     def to_json(self) -> str:
         data = asdict(self)
         data["pages"] = [asdict(p) for p in self.pages]
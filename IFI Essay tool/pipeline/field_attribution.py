@@ -7,6 +7,7 @@ from idp_guardrails_core.core import (
     build_field_attribution_debug_payload,
     compute_field_attribution_confidence,
     compute_field_source_pages,
+    field_source_pages_from_attribution,
     find_grade_page,
     find_value_page,
     write_field_attribution_debug_artifact,
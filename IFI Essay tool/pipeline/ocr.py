@@ -7,11 +7,18 @@ import io
 import json
 import os
 import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Protocol
+from typing import Iterator, Optional, Protocol
 from pipeline.schema import OcrResult
 import fitz
 
+# Max concurrent provider calls per PDF in ocr_pdf_pages (network-bound providers only).
+OCR_PAGE_WORKERS = 4
+
 
 def _confidence_stats(confidences: list[float], low_threshold: float = 0.65) -> tuple[float, float, int]:
     """
@@ -72,6 +79,7 @@ def extract_pdf_text_layer(
     Returns (per_page_results, total_pages) with same shape as ocr_pdf_pages:
       each dict: page_index, text, confidence_avg=1.0, confidence_min, confidence_p10,
       low_conf_page_count=0, char_count
+    Results follow the order of `pages` (ascending page_index when pages is None).
     """
     doc = fitz.open(pdf_path)
     page_indices = pages if pages is not None else list(range(len(doc)))
@@ -173,6 +181,30 @@ def get_ocr_result_from_pdf_text_layer(pdf_path: str) -> OcrResult | None:
     )
 
 
+def _render_page_png(doc: fitz.Document, idx: int, mode: str) -> str:
+    """Render one page (full or top_strip) at 300 dpi to a temp PNG and return its path."""
+    page = doc.load_page(idx)
+    rect = page.rect
+    if mode == "top_strip":
+        clip = fitz.Rect(rect.x0, rect.y0, rect.x1, rect.y0 + rect.height * 0.25)
+    else:
+        clip = rect
+    pix = page.get_pixmap(clip=clip, dpi=300)
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp_img:
+        tmp_img.write(pix.tobytes())
+        return tmp_img.name
+
+
+def _process_and_unlink(provider: "OcrProvider", tmp_path: str) -> OcrResult:
+    try:
+        return provider.process_image(tmp_path)
+    finally:
+        try:
+            os.unlink(tmp_path)
+        except Exception:
+            pass
+
+
 def ocr_pdf_pages(
     pdf_path: str,
     pages: list[int] | None = None,
@@ -187,29 +219,13 @@ def ocr_pdf_pages(
       - top_strip: render top 25% of page (for header detection)
     Returns (per_page_results, total_pages_ocrd)
     Each per_page_result: {page_index, text, confidence_avg, confidence_min, confidence_p10, low_conf_page_count, char_count}
+    Results follow the order of `pages` (ascending page_index when pages is None).
     """
     doc = fitz.open(pdf_path)
     page_indices = pages if pages is not None else list(range(len(doc)))
     provider = provider or get_ocr_provider(provider_name)
-    results = []
-    for idx in page_indices:
-        page = doc.load_page(idx)
-        rect = page.rect
-        if mode == "top_strip":
-            clip = fitz.Rect(rect.x0, rect.y0, rect.x1, rect.y0 + rect.height * 0.25)
-        else:
-            clip = rect
-        pix = page.get_pixmap(clip=clip, dpi=300)
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp_img:
-            tmp_img.write(pix.tobytes())
-            tmp_path = tmp_img.name
-        try:
-            ocr_res = provider.process_image(tmp_path)
-        finally:
-            try:
-                os.unlink(tmp_path)
-            except Exception:
-                pass
+
+    def page_entry(idx: int, ocr_res: OcrResult) -> dict:
         confs = [ocr_res.confidence_avg or 0.0]
         min_conf, p10_conf, low_conf = _confidence_stats(confs)
         entry = {
@@ -222,7 +238,32 @@ def ocr_pdf_pages(
         }
         if include_text:
             entry["text"] = ocr_res.text or ""
-        results.append(entry)
+        return entry
+
+    results = []
+    try:
+        workers = min(OCR_PAGE_WORKERS, len(page_indices))
+        if workers > 1 and getattr(provider, "supports_concurrent_pages", False):
+            # Rendering stays on this thread (a fitz Document is not thread-safe); at most
+            # `workers` pages are rendered-but-unfinished at once, and each worker deletes
+            # its PNG when the provider call returns. Results are collected in page order.
+            in_flight: deque = deque()
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                for idx in page_indices:
+                    if len(in_flight) >= workers:
+                        done_idx, future = in_flight.popleft()
+                        results.append(page_entry(done_idx, future.result()))
+                    tmp_path = _render_page_png(doc, idx, mode)
+                    in_flight.append((idx, ex.submit(_process_and_unlink, provider, tmp_path)))
+                while in_flight:
+                    done_idx, future = in_flight.popleft()
+                    results.append(page_entry(done_idx, future.result()))
+        else:
+            for idx in page_indices:
+                tmp_path = _render_page_png(doc, idx, mode)
+                results.append(page_entry(idx, _process_and_unlink(provider, tmp_path)))
+    finally:
+        doc.close()
 
     # Guardrail: per-page OCR output must be 1:1 with requested page indices.
     if len(results) != len(page_indices):
@@ -354,6 +395,9 @@ class GoogleVisionOcrProvider:
         - Cloud Vision API enabled in Google Cloud Console
         - Billing enabled (if required)
     """
+
+    # ImageAnnotatorClient is thread-safe; ocr_pdf_pages may OCR pages concurrently.
+    supports_concurrent_pages = True
     
     def __init__(self):
         from google.oauth2 import service_account
@@ -667,6 +711,24 @@ def ensure_google_credentials() -> None:
     _require_google_credentials()
 
 
+# Provider installed by override_provider(); takes precedence over the name passed to get_ocr_provider.
+_OCR_PROVIDER_OVERRIDE: ContextVar[Optional[OcrProvider]] = ContextVar("_ocr_provider_override", default=None)
+
+
+@contextmanager
+def override_provider(provider: OcrProvider) -> Iterator[OcrProvider]:
+    """
+    Make get_ocr_provider() return `provider` within this context (current thread/task only).
+
+    Works for modules that imported get_ocr_provider by name, unlike monkeypatching the module attribute.
+    """
+    token = _OCR_PROVIDER_OVERRIDE.set(provider)
+    try:
+        yield provider
+    finally:
+        _OCR_PROVIDER_OVERRIDE.reset(token)
+
+
 def get_ocr_provider(name: str = "stub") -> OcrProvider:
     """
     Factory function to get OCR provider by name.
@@ -675,8 +737,11 @@ def get_ocr_provider(name: str = "stub") -> OcrProvider:
         name: Provider name ("stub", "google", or "easyocr")
         
     Returns:
-        OcrProvider instance
+        OcrProvider instance (the active override_provider() provider, if any)
     """
+    override = _OCR_PROVIDER_OVERRIDE.get()
+    if override is not None:
+        return override
     if name == "stub":
         return StubOcrProvider()
     elif name == "google":
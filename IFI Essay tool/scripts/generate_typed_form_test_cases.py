@@ -8,7 +8,10 @@ Usage (from repo root or IFI Essay tool):
   python scripts/generate_typed_form_test_cases.py
   python scripts/generate_typed_form_test_cases.py path/to/source-filled.pdf
 """
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import fitz
@@ -129,16 +132,28 @@ def form_data_for_test_case(tc: dict) -> dict:
     }
 
 
-def fill_form_from_data(doc: fitz.Document, data: dict) -> None:
-    """Overwrite form fields on page 0 with data. Handles Group1 (Writing About) if present. Empty strings clear the field."""
+def fill_form_from_data(doc: fitz.Document, data: dict, force_clear: set[str] = frozenset()) -> None:
+    """Overwrite form fields on page 0 with data. Handles Group1 (Writing About) if present. Empty strings clear the field.
+
+    Fields named in force_clear are blanked in the same pass (so viewers show them empty),
+    instead of reloading the page and walking the widgets a second time.
+    """
     page = doc.load_page(0)
     widgets = list(page.widgets())
     for w in widgets:
         name = w.field_name
-        if name in data:
-            val = data[name] if data[name] is not None else ""
-            w.field_value = val
+        if name in force_clear:
+            w.field_value = ""
             w.update()
+            continue
+        if name not in data:
+            continue
+        val = data[name] if data[name] is not None else ""
+        # Skip the widget commit when the field already holds this value.
+        if str(w.field_value or "") == str(val):
+            continue
+        w.field_value = val
+        w.update()
     # Writing About: first radio = Father (same as reference)
     group1_radios = [w for w in widgets if w.field_name == "Group1"]
     if group1_radios:
@@ -146,16 +161,6 @@ def fill_form_from_data(doc: fitz.Document, data: dict) -> None:
         group1_radios[0].update()
 
 
-def clear_field_by_name(doc: fitz.Document, field_name: str) -> None:
-    """Force-clear a form field by name (so empty value actually shows as blank in viewers)."""
-    page = doc.load_page(0)
-    for w in page.widgets():
-        if w.field_name == field_name:
-            w.field_value = ""
-            w.update()
-            break
-
-
 # Output filenames for validation test cases (missing required field)
 MISSING_FIELD_OUTPUT_NAMES = {
     "tc06": "tc06_standard_form_missing_grade.pdf",
@@ -163,27 +168,46 @@ MISSING_FIELD_OUTPUT_NAMES = {
     "tc08": "tc08_standard_form_missing_school_name.pdf",
 }
 
+# Fields force-cleared so viewers show them blank (tc06=Grade, tc07=Student, tc08=School)
+FORCE_CLEAR_BY_ID = {
+    "tc06": "Grade",
+    "tc07": "Student's Name",
+    "tc08": "School",
+}
+
+
+def _render_one(tc: dict, src_bytes: bytes, out_dir: Path, missing_names: dict) -> Path:
+    """Fill one test case into a fresh copy of the source form and save it; return the output path."""
+    data = form_data_for_test_case(tc)
+    fc = FORCE_CLEAR_BY_ID.get(tc["id"])
+    out_name = missing_names.get(tc.get("id")) or f"{tc['id']}_standard_form_26-IFI-filled.pdf"
+    out_path = out_dir / out_name
+    with fitz.open(stream=src_bytes, filetype="pdf") as doc:
+        fill_form_from_data(doc, data, force_clear={fc} if fc else frozenset())
+        # These are disposable test fixtures: skip clean/garbage collection of the xref (deflate keeps them small).
+        doc.save(
+            str(out_path), incremental=False, encryption=fitz.PDF_ENCRYPT_NONE, clean=False, garbage=0,
+            deflate=True, deflate_images=True, deflate_fonts=True,
+        )
+    return out_path
+
 
 def generate_test_case_pdfs(source_pdf: Path, out_dir: Path) -> list[Path]:
-    """Generate test case PDFs (tc01–tc05 + tc06–tc08 missing-field cases); return list of output paths."""
+    """Generate test case PDFs (tc01–tc05 + tc06–tc08 missing-field cases); return list of output paths.
+
+    Each case is independent, so they are rendered in worker processes from one in-memory copy of the source
+    (serially when only one CPU is available).
+    """
     out_dir.mkdir(parents=True, exist_ok=True)
-    created = []
-    for tc in TEST_CASES:
-        doc = fitz.open(str(source_pdf))
-        data = form_data_for_test_case(tc)
-        fill_form_from_data(doc, data)
-        # Force-clear fields that must be empty so viewers show them blank (tc06=Grade, tc07=Student, tc08=School)
-        if tc.get("id") == "tc06":
-            clear_field_by_name(doc, "Grade")
-        elif tc.get("id") == "tc07":
-            clear_field_by_name(doc, "Student's Name")
-        elif tc.get("id") == "tc08":
-            clear_field_by_name(doc, "School")
-        out_name = MISSING_FIELD_OUTPUT_NAMES.get(tc.get("id")) or f"{tc['id']}_standard_form_26-IFI-filled.pdf"
-        out_path = out_dir / out_name
-        doc.save(str(out_path), incremental=False, encryption=fitz.PDF_ENCRYPT_NONE, clean=True)
-        doc.close()
-        created.append(out_path)
+    src_bytes = source_pdf.read_bytes()
+    render = partial(_render_one, src_bytes=src_bytes, out_dir=out_dir, missing_names=MISSING_FIELD_OUTPUT_NAMES)
+    max_workers = min(8, os.cpu_count() or 1)
+    if max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as ex:
+            created = list(ex.map(render, TEST_CASES))
+    else:
+        created = [render(tc) for tc in TEST_CASES]
+    for out_path in created:
         print(f"  {out_path.name}")
     return created
 
@@ -6,12 +6,36 @@ Scans artifacts directory and imports all processed records.
 
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from pipeline.database import init_database, save_record
+
+import orjson
+
+from pipeline.database import init_database, save_record, save_records_bulk
 from pipeline.schema import SubmissionRecord
 from pipeline.validate import validate_record
 
 
+ARTIFACT_FILES = ("metadata.json", "structured.json", "ocr.json", "validation.json")
+
+
+def _read_artifact_json(artifact_dir: Path, name: str):
+    """
+    Parse artifact_dir/name; None when the file is missing or unreadable.
+    Invalid JSON raises ValueError (counted as an import error by the caller).
+    """
+    try:
+        raw = (artifact_dir / name).read_bytes()
+    except OSError:
+        return None
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # orjson rejects the NaN/Infinity tokens json.dump writes for non-finite floats.
+        return json.loads(raw)
+
+
 def import_artifacts(artifacts_dir: str = "artifacts"):
     """Import all artifacts from the artifacts directory into the database."""
     artifacts_path = Path(artifacts_dir)
@@ -36,80 +60,75 @@ def import_artifacts(artifacts_dir: str = "artifacts"):
     imported = 0
     skipped = 0
     errors = 0
+    pending = []
     
-    for artifact_dir in artifact_dirs:
-        try:
-            # Read metadata.json
-            metadata_path = artifact_dir / "metadata.json"
-            if not metadata_path.exists():
-                print(f"⚠️  Skipping {artifact_dir.name}: no metadata.json")
-                skipped += 1
-                continue
+    # One small pool for the whole run: each directory's artifact files are read and parsed
+    # concurrently, and only the directory being imported is held in memory.
+    with ThreadPoolExecutor(max_workers=len(ARTIFACT_FILES)) as executor:
+        for artifact_dir in artifact_dirs:
+            try:
+                metadata, structured, ocr_data, validation = executor.map(
+                    partial(_read_artifact_json, artifact_dir), ARTIFACT_FILES
+                )
+                if metadata is None:
+                    print(f"⚠️  Skipping {artifact_dir.name}: no metadata.json")
+                    skipped += 1
+                    continue
             
-            with open(metadata_path, "r", encoding="utf-8") as f:
-                metadata = json.load(f)
+                submission_id = metadata.get("submission_id") or artifact_dir.name
+                original_filename = metadata.get("original_filename", "unknown")
+                artifact_dir_str = str(artifact_dir)
             
-            submission_id = metadata.get("submission_id") or artifact_dir.name
-            original_filename = metadata.get("original_filename", "unknown")
-            artifact_dir_str = str(artifact_dir)
+                if structured is None:
+                    print(f"⚠️  Skipping {submission_id}: no structured.json")
+                    skipped += 1
+                    continue
             
-            # Read structured.json
-            structured_path = artifact_dir / "structured.json"
-            if not structured_path.exists():
-                print(f"⚠️  Skipping {submission_id}: no structured.json")
-                skipped += 1
-                continue
-            
-            with open(structured_path, "r", encoding="utf-8") as f:
-                structured = json.load(f)
-            
-            # Read ocr.json for confidence
-            ocr_confidence = None
-            ocr_path = artifact_dir / "ocr.json"
-            if ocr_path.exists():
-                with open(ocr_path, "r", encoding="utf-8") as f:
-                    ocr_data = json.load(f)
+                # ocr.json for confidence
+                ocr_confidence = None
+                if ocr_data is not None:
                     ocr_confidence = ocr_data.get("confidence_avg")
             
-            # Read validation.json if exists (but we'll override needs_review)
-            review_reason_codes = ""
-            validation_path = artifact_dir / "validation.json"
-            if validation_path.exists():
-                with open(validation_path, "r", encoding="utf-8") as f:
-                    validation = json.load(f)
+                # validation.json if exists (but we'll override needs_review)
+                review_reason_codes = ""
+                if validation is not None:
                     review_reason_codes = validation.get("review_reason_codes", "")
             
-            # Remove _ifi_metadata from structured data if present
-            structured_clean = {k: v for k, v in structured.items() if k != "_ifi_metadata"}
-            
-            # Build partial record dict for validation
-            partial_record = {
-                "submission_id": submission_id,
-                "artifact_dir": artifact_dir_str,
-                "word_count": structured_clean.get("word_count", 0),
-                "ocr_confidence_avg": ocr_confidence,
-                **structured_clean
-            }
+                # Remove _ifi_metadata from structured data if present
+                structured_clean = {k: v for k, v in structured.items() if k != "_ifi_metadata"}
             
-            # Validate and create record (this will set needs_review=True by default)
-            record, validation_report = validate_record(partial_record)
+                # Build partial record dict for validation
+                partial_record = {
+                    "submission_id": submission_id,
+                    "artifact_dir": artifact_dir_str,
+                    "word_count": structured_clean.get("word_count", 0),
+                    "ocr_confidence_avg": ocr_confidence,
+                    **structured_clean
+                }
             
-            # Override review_reason_codes with existing one if it exists, otherwise use new one
-            if review_reason_codes:
-                record.review_reason_codes = review_reason_codes
+                # Validate and create record (this will set needs_review=True by default)
+                record, validation_report = validate_record(partial_record)
             
-            # Save to database
-            success = save_record(record, filename=original_filename)
+                # Override review_reason_codes with existing one if it exists, otherwise use new one
+                if review_reason_codes:
+                    record.review_reason_codes = review_reason_codes
             
-            if success:
-                print(f"✅ Imported: {submission_id} - {original_filename}")
-                imported += 1
-            else:
-                print(f"❌ Failed to save: {submission_id}")
-                errors += 1
+                # Queue for a single bulk save after the scan
+                pending.append((record, original_filename))
                 
-        except Exception as e:
-            print(f"❌ Error importing {artifact_dir.name}: {e}")
+            except Exception as e:
+                print(f"❌ Error importing {artifact_dir.name}: {e}")
+                errors += 1
+    
+    # Save to database in one transaction; if that is rolled back, retry
+    # record-by-record so one bad artifact doesn't block the rest.
+    saved = save_records_bulk(pending)
+    for record, original_filename in pending:
+        if saved or save_record(record, filename=original_filename):
+            print(f"✅ Imported: {record.submission_id} - {original_filename}")
+            imported += 1
+        else:
+            print(f"❌ Failed to save: {record.submission_id}")
             errors += 1
     
     print("\n" + "="*50)
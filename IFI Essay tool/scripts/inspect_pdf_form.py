@@ -12,6 +12,18 @@ from pathlib import Path
 import fitz
 
 
+def first_lines(text: str, n: int):
+    """Yield up to n newline-separated lines of text without splitting the rest of it."""
+    start = 0
+    for _ in range(n):
+        nl = text.find("\n", start)
+        if nl < 0:
+            yield text[start:]
+            return
+        yield text[start:nl]
+        start = nl + 1
+
+
 def main() -> None:
     if len(sys.argv) < 2:
         print("Usage: python scripts/inspect_pdf_form.py <path/to.pdf>", file=sys.stderr)
@@ -36,7 +48,7 @@ def main() -> None:
             print(f"  {name!r} => {val!r}")
     print("\n=== Page 0 text (first 60 lines) ===")
     text = (page.get_text("text") or "").strip()
-    for i, ln in enumerate(text.split("\n")[:60]):
+    for i, ln in enumerate(first_lines(text, 60)):
         print(f"{i:2} {ln!r}")
     doc.close()
 
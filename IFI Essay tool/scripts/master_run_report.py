@@ -12,18 +12,34 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import sys
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
+
 
 def read_json(path: Path) -> Optional[Dict[str, Any]]:
     if not path.exists():
         return None
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
+        data = path.read_bytes()
+    except OSError as e:
+        print(f"Skipping unreadable {path}: {e}", file=sys.stderr)
+        return None
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        pass
+    # orjson rejects the NaN/Infinity tokens json.dump writes for non-finite floats.
+    try:
+        return json.loads(data)
+    except ValueError as e:
+        print(f"Skipping invalid JSON {path}: {e}", file=sys.stderr)
         return None
 
 
@@ -37,72 +53,94 @@ def ocr_bucket(conf: Optional[float]) -> str:
     return "high(>=0.75)"
 
 
+ARTIFACT_FILES = ("extraction_debug.json", "validation.json", "ocr.json", "structured.json", "metadata.json")
+
+
 def load_run_records(artifacts_dir: Path) -> List[Dict[str, Any]]:
     records: List[Dict[str, Any]] = []
-    for subdir in sorted(artifacts_dir.iterdir()):
-        if not subdir.is_dir():
-            continue
-        if subdir.name in {"log_exports", "master_reports"}:
-            continue
-        extraction_debug = read_json(subdir / "extraction_debug.json")
-        validation = read_json(subdir / "validation.json")
-        ocr = read_json(subdir / "ocr.json")
-        structured = read_json(subdir / "structured.json")
-        metadata = read_json(subdir / "metadata.json")
-        if not any([extraction_debug, validation, ocr, structured, metadata]):
-            continue
-
-        required = (extraction_debug or {}).get("required_fields_found") or {}
-        parse_success = bool(
-            required.get("student_name")
-            and required.get("school_name")
-            and required.get("grade")
+    # scandir reuses the dirent type, so is_dir() needs no extra stat per entry.
+    with os.scandir(artifacts_dir) as it:
+        entries = sorted(
+            (e for e in it if e.is_dir(follow_symlinks=False) and e.name not in {"log_exports", "master_reports"}),
+            key=lambda e: e.name,
         )
+    subdirs = [Path(e.path) for e in entries]
+    # One small pool for the whole report: each run's artifact files are read concurrently,
+    # and only the run being summarised is held in memory.
+    with ThreadPoolExecutor(max_workers=len(ARTIFACT_FILES)) as executor:
+        for subdir in subdirs:
+            extraction_debug, validation, ocr, structured, metadata = executor.map(
+                read_json, [subdir / name for name in ARTIFACT_FILES]
+            )
+            if not any([extraction_debug, validation, ocr, structured, metadata]):
+                continue
 
-        issues = (validation or {}).get("issues") or []
-        if not isinstance(issues, list):
-            issues = [str(issues)]
-        reason_codes = (validation or {}).get("review_reason_codes") or ""
-        reason_list = [r.strip().upper() for r in str(reason_codes).replace(",", ";").split(";") if r.strip()]
-
-        confidence_avg = (ocr or {}).get("confidence_avg")
-        if confidence_avg is None:
-            confidence_avg = (structured or {}).get("ocr_confidence_avg")
-
-        rec = {
-            "submission_id": subdir.name,
-            "created_at": (metadata or {}).get("created_at"),
-            "ocr_confidence_avg": confidence_avg,
-            "ocr_bucket": ocr_bucket(confidence_avg),
-            "ocr_line_count": len((ocr or {}).get("lines") or []),
-            "ocr_text_len": len((ocr or {}).get("text") or ""),
-            "needs_review": bool((validation or {}).get("needs_review")),
-            "issues": issues,
-            "reason_codes": reason_list,
-            "parse_success_required_fields": parse_success,
-            "extraction_method": (extraction_debug or {}).get("extraction_method", "unknown"),
-            "parse_model": (extraction_debug or {}).get("model", "unknown"),
-            "ifi_doc_type": ((extraction_debug or {}).get("ifi_classification") or {}).get("doc_type"),
-            "word_count": (structured or {}).get("word_count"),
-        }
-        records.append(rec)
+            required = (extraction_debug or {}).get("required_fields_found") or {}
+            parse_success = bool(
+                required.get("student_name")
+                and required.get("school_name")
+                and required.get("grade")
+            )
+
+            issues = (validation or {}).get("issues") or []
+            if not isinstance(issues, list):
+                issues = [str(issues)]
+            reason_codes = (validation or {}).get("review_reason_codes") or ""
+            reason_list = [r.strip().upper() for r in str(reason_codes).replace(",", ";").split(";") if r.strip()]
+
+            confidence_avg = (ocr or {}).get("confidence_avg")
+            if confidence_avg is None:
+                confidence_avg = (structured or {}).get("ocr_confidence_avg")
+
+            rec = {
+                "submission_id": subdir.name,
+                "created_at": (metadata or {}).get("created_at"),
+                "ocr_confidence_avg": confidence_avg,
+                "ocr_bucket": ocr_bucket(confidence_avg),
+                "ocr_line_count": len((ocr or {}).get("lines") or []),
+                "ocr_text_len": len((ocr or {}).get("text") or ""),
+                "needs_review": bool((validation or {}).get("needs_review")),
+                "issues": issues,
+                "reason_codes": reason_list,
+                "parse_success_required_fields": parse_success,
+                "extraction_method": (extraction_debug or {}).get("extraction_method", "unknown"),
+                "parse_model": (extraction_debug or {}).get("model", "unknown"),
+                "ifi_doc_type": ((extraction_debug or {}).get("ifi_classification") or {}).get("doc_type"),
+                "word_count": (structured or {}).get("word_count"),
+            }
+            records.append(rec)
     return records
 
 
 def build_summary(records: List[Dict[str, Any]]) -> Dict[str, Any]:
     total = len(records)
-    method_counts = Counter(r["extraction_method"] for r in records)
-    model_counts = Counter(r["parse_model"] for r in records)
+    method_counts = Counter()
+    model_counts = Counter()
     issue_counts = Counter()
     reason_counts = Counter()
-    by_bucket = Counter(r["ocr_bucket"] for r in records)
+    by_bucket = Counter()
     parse_fail_by_bucket = Counter()
     parse_fail_by_method = Counter()
     parse_total_by_method = Counter()
     matrix = defaultdict(lambda: {"parse_success": 0, "parse_failure": 0})
     high_ocr_parse_fail: List[Dict[str, Any]] = []
+    review_count = 0
+    wc_non_null = 0
+    wc_count = 0
+    wc_sum = 0.0
 
     for r in records:
+        method_counts[r["extraction_method"]] += 1
+        model_counts[r["parse_model"]] += 1
+        by_bucket[r["ocr_bucket"]] += 1
+        if r["needs_review"]:
+            review_count += 1
+        w = r.get("word_count")
+        if w is not None:
+            wc_non_null += 1
+            if isinstance(w, (int, float)):
+                wc_sum += float(w)
+                wc_count += 1
         for issue in r["issues"]:
             issue_counts[str(issue).upper()] += 1
         for reason in r["reason_codes"]:
@@ -135,7 +173,6 @@ def build_summary(records: List[Dict[str, Any]]) -> Dict[str, Any]:
         b: (parse_fail_by_bucket[b] / by_bucket[b] if by_bucket[b] else 0.0)
         for b in sorted(by_bucket.keys())
     }
-    review_count = sum(1 for r in records if r["needs_review"])
 
     return {
         "total_runs_analyzed": total,
@@ -156,11 +193,8 @@ def build_summary(records: List[Dict[str, Any]]) -> Dict[str, Any]:
         "distributions": {
             "ocr_bucket_distribution": dict(by_bucket),
             "word_count_stats": {
-                "non_null_count": sum(1 for r in records if r.get("word_count") is not None),
-                "avg": (
-                    sum(float(r["word_count"]) for r in records if isinstance(r.get("word_count"), (int, float)))
-                    / max(1, sum(1 for r in records if isinstance(r.get("word_count"), (int, float))))
-                ),
+                "non_null_count": wc_non_null,
+                "avg": wc_sum / wc_count if wc_count else 0.0,
             },
         },
     }
@@ -231,12 +265,13 @@ def main() -> int:
         "artifacts_dir": str(artifacts_dir),
     }
 
-    (out_dir / "master_summary.json").write_text(json.dumps(summary, indent=2, ensure_ascii=True), encoding="utf-8")
-    (out_dir / "master_summary.md").write_text(build_markdown(summary), encoding="utf-8")
-    (out_dir / "records_analyzed.jsonl").write_text(
-        "".join(json.dumps(r, ensure_ascii=True) + "\n" for r in records),
-        encoding="utf-8",
+    (out_dir / "master_summary.json").write_bytes(
+        orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
     )
+    (out_dir / "master_summary.md").write_text(build_markdown(summary), encoding="utf-8")
+    with (out_dir / "records_analyzed.jsonl").open("wb", buffering=1 << 20) as f:
+        for r in records:
+            f.write(orjson.dumps(r, option=orjson.OPT_APPEND_NEWLINE))
     print(f"Master report generated: {out_dir}")
     return 0
 
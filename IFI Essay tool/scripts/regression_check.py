@@ -18,23 +18,33 @@ Run from project root as a module:
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import os
+import pickle
 import re
+import shutil
 import sys
 import tempfile
 import time
 import hashlib
+import heapq
+import inspect
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple
 
 import fitz  # PyMuPDF
+import orjson
 
 HERE = Path(__file__).resolve().parent
 REPO_ROOT = HERE.parent
 
-from pipeline.document_analysis import analyze_document, ChunkRange
+from pipeline.document_analysis import analyze_document, ChunkRange, DocumentAnalysis
 from pipeline.runner import process_submission
-from pipeline.ocr import ocr_pdf_pages, extract_pdf_text_layer
+from pipeline.ocr import ocr_pdf_pages, extract_pdf_text_layer, override_provider
+from pipeline.schema import OcrResult
 from pipeline.extract import looks_like_essay_fragment
 from pipeline.doc_type_routing import detect_pdf_has_acroform_fields, route_doc_type
 from idp_guardrails_core.core import (
@@ -46,76 +56,161 @@ from idp_guardrails_core.core import (
     classify_doc_role,
     compare_snapshots,
     compute_field_attribution_confidence,
-    compute_field_source_pages,
+    field_source_pages_from_attribution,
     load_per_page_text,
 )
 
 
+HYBRID_FIXTURE_TEXT = "Hybrid Header\nStudent Name: Hybrid Test\nGrade: 6"
+SCANNED_FIXTURE_TEXT = "Handwritten style (synthetic)\nSchool: Sample School\nGrade: 7"
+MULTI_FIXTURE_TEXTS = (
+    "IFI Fatherhood Essay Contest\nStudent Name: First Student\nGrade: 6\nSchool: Lincoln",
+    "Essay body page 1.\nMore essay text.",
+    "Essay body page 2 continuing.",
+    "IFI Fatherhood Essay Contest\nStudent Name: Second Student\nGrade: 8\nSchool: Carson",
+    "Second essay body page 1.",
+)
+
+
+def _write_json(path: Path, obj, atomic: bool = False) -> None:
+    """
+    Write an indented JSON artifact (orjson; non-str keys allowed like json.dump).
+    atomic: write a temp file and os.replace it, for files other steps read back
+    (doc_summary.json, batch summaries, run snapshots); no fsync either way.
+    """
+    data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    if not atomic:
+        path.write_bytes(data)
+        return
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+# Generated fixtures are reused across runs from this repo-local (git-ignored) directory.
+_FIXTURE_CACHE_DIR = REPO_ROOT / "artifacts" / ".fixture_cache"
+
+
+def _fixture_cache_path(generator, *texts: str) -> Path:
+    """
+    Cache location for a generated fixture, keyed by the generator's source, its text
+    inputs and the PyMuPDF version, so editing a generator never reuses a stale PDF.
+    """
+    h = hashlib.sha1(inspect.getsource(generator).encode("utf-8"))
+    h.update(repr(fitz.VersionBind).encode("utf-8"))
+    for text in texts:
+        h.update(text.encode("utf-8") + b"\0")
+    kind = generator.__name__.removeprefix("generate_").removesuffix("_fixture")
+    return _FIXTURE_CACHE_DIR / f"{kind}_{h.hexdigest()[:16]}.pdf"
+
+
+def _load_cached_fixture(cache_path: Path, out_path: Path) -> bool:
+    """Copy a cached fixture to out_path; return False when there is no cache entry."""
+    if not cache_path.exists():
+        return False
+    shutil.copy(cache_path, out_path)
+    return True
+
+
+def _store_cached_fixture(out_path: Path, cache_path: Path) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    shutil.copy(out_path, tmp_path)
+    os.replace(tmp_path, cache_path)
+
+
 def generate_hybrid_fixture(tmpdir: Path) -> Path:
     """Create a small two-page hybrid PDF (page1 text layer, page2 image)."""
+    out_path = tmpdir / "hybrid_fixture.pdf"
+    cache_path = _fixture_cache_path(generate_hybrid_fixture, HYBRID_FIXTURE_TEXT)
+    if _load_cached_fixture(cache_path, out_path):
+        return out_path
+
     doc = fitz.open()
     page1 = doc.new_page()
-    page1.insert_text((72, 72), "Hybrid Header\nStudent Name: Hybrid Test\nGrade: 6")
+    page1.insert_text((72, 72), HYBRID_FIXTURE_TEXT)
 
     # Render page1 to image for page2
     pix = page1.get_pixmap(dpi=200)
-    png_bytes = pix.tobytes("png")
     page2 = doc.new_page()
-    page2.insert_image(page2.rect, stream=png_bytes)
+    # Embed the pixmap directly (no PNG encode/decode round trip).
+    page2.insert_image(page2.rect, pixmap=pix)
 
-    out_path = tmpdir / "hybrid_fixture.pdf"
-    doc.save(out_path)
+    doc.save(out_path, deflate=True, deflate_images=True)
     doc.close()
+    _store_cached_fixture(out_path, cache_path)
     return out_path
 
 
 def generate_scanned_fixture(tmpdir: Path) -> Path:
     """Create an image-only PDF by rasterizing a text page."""
+    out_path = tmpdir / "scanned_fixture.pdf"
+    cache_path = _fixture_cache_path(generate_scanned_fixture, SCANNED_FIXTURE_TEXT)
+    if _load_cached_fixture(cache_path, out_path):
+        return out_path
+
     doc = fitz.open()
     page = doc.new_page()
-    page.insert_text((72, 72), "Handwritten style (synthetic)\nSchool: Sample School\nGrade: 7")
+    page.insert_text((72, 72), SCANNED_FIXTURE_TEXT)
     pix = page.get_pixmap(dpi=200)
-    png_bytes = pix.tobytes("png")
-    doc_img = fitz.open()
-    page_img = doc_img.new_page()
-    page_img.insert_image(page_img.rect, stream=png_bytes)
-    out_path = tmpdir / "scanned_fixture.pdf"
-    doc_img.save(out_path)
+    # Swap the text page for an image of itself in the same document.
+    page_img = doc.new_page()
+    page_img.insert_image(page_img.rect, pixmap=pix)
+    doc.delete_page(0)
+    doc.save(out_path, garbage=3, deflate=True, deflate_images=True)
     doc.close()
-    doc_img.close()
+    _store_cached_fixture(out_path, cache_path)
     return out_path
 
 
 def generate_multi_fixture(tmpdir: Path) -> Path:
     """Create a synthetic multi-submission PDF with two distinct headers."""
+    out_path = tmpdir / "multi_fixture.pdf"
+    cache_path = _fixture_cache_path(generate_multi_fixture, *MULTI_FIXTURE_TEXTS)
+    if _load_cached_fixture(cache_path, out_path):
+        return out_path
+
+    header1, body1, body2, header2, body3 = MULTI_FIXTURE_TEXTS
     doc = fitz.open()
     # First submission
     p1 = doc.new_page()
-    p1.insert_text((72, 72), "IFI Fatherhood Essay Contest\nStudent Name: First Student\nGrade: 6\nSchool: Lincoln")
-    p1.insert_text((72, 140), "Essay body page 1.\nMore essay text.")
+    p1.insert_text((72, 72), header1)
+    p1.insert_text((72, 140), body1)
     p2 = doc.new_page()
-    p2.insert_text((72, 72), "Essay body page 2 continuing.")
+    p2.insert_text((72, 72), body2)
     # Second submission
     p3 = doc.new_page()
-    p3.insert_text((72, 72), "IFI Fatherhood Essay Contest\nStudent Name: Second Student\nGrade: 8\nSchool: Carson")
-    p3.insert_text((72, 140), "Second essay body page 1.")
-    out_path = tmpdir / "multi_fixture.pdf"
-    doc.save(out_path)
+    p3.insert_text((72, 72), header2)
+    p3.insert_text((72, 140), body3)
+    doc.save(out_path, deflate=True, deflate_images=True)
     doc.close()
+    _store_cached_fixture(out_path, cache_path)
     return out_path
 
 
-def chunk_paths(pdf_path: Path, chunks: List[ChunkRange], tmpdir: Path) -> List[Tuple[int, Path]]:
-    """Split PDF into per-chunk temporary PDFs."""
-    doc = fitz.open(pdf_path)
+def chunk_paths(
+    pdf: Path | fitz.Document, chunks: List[ChunkRange], tmpdir: Path
+) -> List[Tuple[int, Path]]:
+    """
+    Split PDF into per-chunk temporary PDFs.
+    Accepts a path or an already-open document; a passed-in document is left open, so a
+    caller holding the source does not parse it a second time.
+    """
     results: List[Tuple[int, Path]] = []
-    for idx, c in enumerate(chunks):
-        chunk_doc = fitz.open()
-        chunk_doc.insert_pdf(doc, from_page=c.start_page, to_page=c.end_page, widgets=0)
-        out_path = tmpdir / f"chunk_{idx}.pdf"
-        chunk_doc.save(out_path)
-        results.append((idx, out_path))
-    doc.close()
+    owns_doc = not isinstance(pdf, fitz.Document)
+    doc = fitz.open(pdf) if owns_doc else pdf
+    try:
+        for idx, c in enumerate(chunks):
+            chunk_doc = fitz.open()
+            chunk_doc.insert_pdf(doc, from_page=c.start_page, to_page=c.end_page, widgets=0, links=0)
+            out_path = tmpdir / f"chunk_{idx}.pdf"
+            # Transient chunk files are reread once by the pipeline; skip xref cleanup on save.
+            chunk_doc.save(out_path, garbage=0, clean=False, deflate=True)
+            chunk_doc.close()
+            results.append((idx, out_path))
+    finally:
+        if owns_doc:
+            doc.close()
     return results
 
 
@@ -132,10 +227,45 @@ GRADE_PATTERNS = [
 SCHOOL_PATTERNS = [
     r"(?im)\b(?:school(?:\s+name)?|campus|escuela)\s*[:\-]?\s*([^\n\r]{2,120})",
 ]
+# Every grade/school pattern requires one of these literal anchors; when none occur
+# in the (casefolded) text the corresponding pattern group cannot match.
+_GRADE_ANCHORS = ("grade", "grado")
+_SCHOOL_ANCHORS = ("school", "campus", "escuela")
+
+
+def _build_field_re() -> re.Pattern:
+    """
+    Fuse GRADE_PATTERNS and SCHOOL_PATTERNS into one alternation of lookaheads.
+    Each pattern becomes a zero-width named group (grade_N / school_N), so a single
+    finditer sweep reports, at every offset, the highest-priority pattern matching there
+    without consuming text another pattern might need.
+    """
+    parts = []
+    for kind, patterns in (("grade", GRADE_PATTERNS), ("school", SCHOOL_PATTERNS)):
+        for i, p in enumerate(patterns):
+            assert p.startswith("(?im)"), p
+            parts.append(f"(?=(?P<{kind}_{i}>{p[len('(?im)'):]}))")
+    return re.compile("|".join(parts), re.IGNORECASE | re.MULTILINE)
+
+
+_FIELD_RE = _build_field_re()
+# Value capture for each named group is the pattern's own first group, right after it.
+_FIELD_VALUE_GROUP = {name: idx + 1 for name, idx in _FIELD_RE.groupindex.items()}
+_K_TOKENS = frozenset({"K", "KINDER", "KINDERGARTEN", "PRE-K", "PREK"})
+_ORDINAL_RE = re.compile(r"(\d+)(?:st|nd|rd|th)?", re.IGNORECASE)
+_WS_RE = re.compile(r"\s+")
+
+
+# Line boundaries str.splitlines() honours besides "\n"; text without them can skip the split/join.
+_NON_LF_LINE_BREAK_RE = re.compile("[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
 
 
 def _clip_snippet(text: str, max_chars: int = 300, max_lines: int = 20) -> str:
-    lines = (text or "").splitlines()[:max_lines]
+    if not text:
+        return ""
+    if text.count("\n") < max_lines and not _NON_LF_LINE_BREAK_RE.search(text):
+        return text.strip()[:max_chars]
+    lines = text.splitlines()[:max_lines]
     snippet = "\n".join(lines).strip()
     return snippet[:max_chars]
 
@@ -153,43 +283,77 @@ def build_chunk_submission_id(parent_submission_id: str, chunk_index: int, origi
 
 def _is_valid_grade_value(val: str) -> bool:
     """Reject grades outside 1-12. Only 1-12 and K are valid."""
-    if not val or not val.strip():
+    if not val:
         return False
     v = val.strip().upper()
-    if v in ("K", "KINDER", "KINDERGARTEN", "PRE-K", "PREK"):
+    if not v:
+        return False
+    if v in _K_TOKENS:
         return True
+    if v.isdecimal():
+        return 1 <= int(v) <= 12
     try:
         n = int(v)
         return 1 <= n <= 12
     except ValueError:
         # Ordinals like "6th"
-        m = re.search(r"(\d+)(?:st|nd|rd|th)?", v, re.IGNORECASE)
+        m = _ORDINAL_RE.search(v)
         if m:
             return 1 <= int(m.group(1)) <= 12
         return False
 
 
+# Texts longer than this bypass the extraction cache (avoid pinning huge strings).
+_EXTRACT_CACHE_MAX_CHARS = 200_000
+
+
 def extract_doc_fields_from_final_text(final_text: str) -> Dict[str, str | None]:
     """Extract doc-level school/grade from OCR-aggregated final text."""
-    extracted: Dict[str, str | None] = {"student_name": None, "grade": None, "school_name": None}
+    final_text = final_text or ""
+    if len(final_text) > _EXTRACT_CACHE_MAX_CHARS:
+        return _extract_doc_fields(final_text)
+    # Cached result is shared; hand callers their own dict.
+    return dict(_extract_doc_fields_cached(final_text))
+
+
+@functools.lru_cache(maxsize=512)
+def _extract_doc_fields_cached(final_text: str) -> Dict[str, str | None]:
+    return _extract_doc_fields(final_text)
 
-    for pattern in GRADE_PATTERNS:
-        match = re.search(pattern, final_text or "")
-        if match:
-            raw = match.group(1).strip()
-            if _is_valid_grade_value(raw):
-                extracted["grade"] = raw
+
+def _extract_doc_fields(final_text: str) -> Dict[str, str | None]:
+    extracted: Dict[str, str | None] = {"student_name": None, "grade": None, "school_name": None}
+    text_lc = final_text.casefold()
+    want_grade = any(a in text_lc for a in _GRADE_ANCHORS)
+    want_school = any(a in text_lc for a in _SCHOOL_ANCHORS)
+    if not (want_grade or want_school):
+        return extracted
+
+    # Pattern priority is preserved: keep the first match of the lowest-index pattern.
+    grade_match = None
+    grade_rank = len(GRADE_PATTERNS)
+    school_match = None
+    for m in _FIELD_RE.finditer(final_text):
+        kind, _, rank = m.lastgroup.partition("_")
+        if kind == "grade":
+            if int(rank) < grade_rank:
+                grade_match, grade_rank = m, int(rank)
+        elif school_match is None:
+            school_match = m
+        if grade_rank == 0 and school_match is not None:
             break
 
-    for pattern in SCHOOL_PATTERNS:
-        match = re.search(pattern, final_text or "")
-        if match:
-            school = re.sub(r"\s+", " ", match.group(1)).strip(" .,:;-\t")
-            # Reject essay text captured after "School"/"Escuela" (e.g. "and if anything")
-            if school and not looks_like_essay_fragment(school):
-                extracted["school_name"] = school
-            if extracted.get("school_name"):
-                break
+    if grade_match is not None:
+        raw = grade_match.group(_FIELD_VALUE_GROUP[grade_match.lastgroup]).strip()
+        if _is_valid_grade_value(raw):
+            extracted["grade"] = raw
+
+    if school_match is not None:
+        value = school_match.group(_FIELD_VALUE_GROUP[school_match.lastgroup])
+        school = _WS_RE.sub(" ", value).strip(" .,:;-\t")
+        # Reject essay text captured after "School"/"Escuela" (e.g. "and if anything")
+        if school and not looks_like_essay_fragment(school):
+            extracted["school_name"] = school
 
     return extracted
 
@@ -217,7 +381,7 @@ def apply_doc_review_metrics(
     doc_role: DocRole,
     doc_type: str,
     doc_needs_review: bool,
-    doc_reason_codes: set[str],
+    doc_reason_codes: set[str] | list[str],
     failures: list[str],
     pdf_name: str,
 ) -> None:
@@ -252,18 +416,39 @@ def apply_doc_review_metrics(
         type_bucket["needs_review"] += 1
 
 
+def _tally_reason_codes(codes: List[str], counts: Counter, failures: List[str]) -> None:
+    """Count normalized reason codes and flag any that are not plain enum values."""
+    counts.update(codes)
+    for code in codes:
+        if "=" in code or code not in ALLOWED_REASON_CODES:
+            failures.append(f"Reason code not enum: {code}")
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_reason_code_str(value: str) -> Tuple[str, ...]:
+    # Records carry a small set of distinct ";"-joined code strings, so most calls are cache hits.
+    return tuple(p for p in (part.strip() for part in value.split(";")) if p)
+
+
 def _normalize_reason_codes(value) -> List[str]:
     if value is None:
         return []
     if isinstance(value, str):
-        parts = [p.strip() for p in value.split(";")]
-    elif isinstance(value, list):
+        return list(_split_reason_code_str(value))
+    if isinstance(value, list):
         parts = [str(p).strip() for p in value]
     else:
         parts = [str(value).strip()]
     return [p for p in parts if p]
 
 
+# Doc-level fields checked against final text: (field, reason code, evidence patterns).
+_DOC_FIELD_CHECKS = (
+    ("grade", "MISSING_GRADE", GRADE_PATTERNS),
+    ("school_name", "MISSING_SCHOOL_NAME", SCHOOL_PATTERNS),
+)
+
+
 def compute_doc_reason_codes(
     *,
     extracted: Dict[str, str | None],
@@ -288,23 +473,18 @@ def compute_doc_reason_codes(
     if template_blocked_low_conf:
         reason_codes.add("OCR_LOW_CONFIDENCE")
 
-    if not extracted.get("grade"):
-        reason_codes.add("MISSING_GRADE")
-        evidence["grade"] = {
-            "source": "final_text_ocr_aggregate",
-            "patterns": GRADE_PATTERNS,
-            "match": None,
-            "snippet": _clip_snippet(final_text),
-            "doc_id": submission_id,
-            "submission_id": submission_id,
-        }
-    if not extracted.get("school_name"):
-        reason_codes.add("MISSING_SCHOOL_NAME")
-        evidence["school_name"] = {
+    snippet = None
+    for field, code, patterns in _DOC_FIELD_CHECKS:
+        if extracted.get(field):
+            continue
+        if snippet is None:
+            snippet = _clip_snippet(final_text)
+        reason_codes.add(code)
+        evidence[field] = {
             "source": "final_text_ocr_aggregate",
-            "patterns": SCHOOL_PATTERNS,
+            "patterns": patterns,
             "match": None,
-            "snippet": _clip_snippet(final_text),
+            "snippet": snippet,
             "doc_id": submission_id,
             "submission_id": submission_id,
         }
@@ -358,26 +538,29 @@ def run_chunk_pipeline(
     return record, report
 
 
+_LOW_CONF_TEXT = "IFI Fatherhood Essay Contest\nStudent Name:\nGrade / Grado:\nSchool / Escuela:"
+_LOW_CONF_RESULT = OcrResult(
+    text=_LOW_CONF_TEXT,
+    confidence_avg=0.1,
+    confidence_min=0.1,
+    confidence_p10=0.1,
+    low_conf_page_count=1,
+    lines=_LOW_CONF_TEXT.splitlines(),
+)
+
+
 class LowConfProvider:
     """Fake OCR provider that returns boilerplate text with very low confidence."""
 
     def process_image(self, image_path: str):
-        from pipeline.schema import OcrResult
-        txt = "IFI Fatherhood Essay Contest\nStudent Name:\nGrade / Grado:\nSchool / Escuela:"
-        return OcrResult(
-            text=txt,
-            confidence_avg=0.1,
-            confidence_min=0.1,
-            confidence_p10=0.1,
-            low_conf_page_count=1,
-            lines=txt.splitlines()
-        )
+        # OcrResult is a mutable pydantic model; a deep copy keeps callers from sharing its lines list.
+        return _LOW_CONF_RESULT.model_copy(deep=True)
 
 
 def compute_submission_id(pdf_path: Path) -> str:
     """Deterministic submission id from file bytes."""
     with open(pdf_path, "rb") as f:
-        h = hashlib.sha256(f.read()).hexdigest()
+        h = hashlib.file_digest(f, "sha256").hexdigest()
     return h[:12]
 
 
@@ -389,6 +572,9 @@ TYPED_FORM_MISSING_FIELD_EXPECTATIONS = {
 }
 
 
+_TYPED_FORM_TC_RE = re.compile(r"tc0[1-8]_.*\.pdf")
+
+
 def validate_typed_form_missing_field_expectations(
     pdf_paths: List[Path], docs_dir: Path
 ) -> List[str]:
@@ -400,7 +586,7 @@ def validate_typed_form_missing_field_expectations(
     if len(pdf_paths) != 8:
         return failures
     names = [p.name for p in pdf_paths]
-    if not all(re.match(r"tc0[1-8]_.*\.pdf", n) for n in names):
+    if not all(_TYPED_FORM_TC_RE.match(n) for n in names):
         return failures
 
     reviewed = 0
@@ -408,13 +594,13 @@ def validate_typed_form_missing_field_expectations(
     for pdf_path in pdf_paths:
         submission_id = compute_submission_id(pdf_path)
         summary_path = docs_dir / submission_id / "doc_summary.json"
-        if not summary_path.exists():
+        try:
+            doc_summary = orjson.loads(summary_path.read_bytes())
+        except FileNotFoundError:
             failures.append(
                 f"Typed-form doc must not fail: no record produced for {pdf_path.name} (expected record for human review)."
             )
             continue
-        with open(summary_path, "r", encoding="utf-8") as f:
-            doc_summary = json.load(f)
         filename = doc_summary.get("filename", "")
         chunk_count = doc_summary.get("chunk_count", 0)
         needs_review = doc_summary.get("needs_review", False)
@@ -457,15 +643,16 @@ def has_multiple_header_peaks(analysis) -> bool:
     scores = [p.header_signature_score for p in analysis.pages]
     if len(scores) < 2:
         return False
+    # Pad with -1.0 so edge pages compare against a sentinel; one zip pass, no index math.
+    lefts = [-1.0, *scores[:-1]]
+    rights = [*scores[1:], -1.0]
     peaks = 0
-    for idx, score in enumerate(scores):
-        if score < 0.2:
-            continue
-        left = scores[idx - 1] if idx > 0 else -1.0
-        right = scores[idx + 1] if idx + 1 < len(scores) else -1.0
-        if score >= left and score >= right:
+    for left, score, right in zip(lefts, scores, rights):
+        if score >= 0.2 and score >= left and score >= right:
             peaks += 1
-    return peaks >= 2
+            if peaks >= 2:
+                return True
+    return False
 
 
 def write_field_attribution_debug_artifact(
@@ -492,19 +679,26 @@ def write_field_attribution_debug_artifact(
     )
     if payload is None:
         return False
-    with open(chunk_artifact_dir / "field_attribution_debug.json", "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
+    _write_json(chunk_artifact_dir / "field_attribution_debug.json", payload)
     return True
 
 
 def enforce_attribution_thresholds(
     attribution_counts_by_doc_type: dict[str, dict[str, int]],
     output_dir: Path,
+    attribution_artifacts_emitted: bool = False,
 ) -> List[str]:
     """
     Enforce attribution rate thresholds by doc type.
+    attribution_artifacts_emitted: per-chunk field_source_pages.json / field_attribution_debug.json
+        were written for every doc (--emit-attribution-artifacts); only affects the failure hint.
     """
     failures: List[str] = []
+    where = f"chunk_diagnostics in {output_dir / 'docs'}/*/doc_summary.json"
+    if attribution_artifacts_emitted:
+        hint = f"See {where} and the per-chunk field_attribution_debug.json files."
+    else:
+        hint = f"See {where}; rerun with --emit-attribution-artifacts for per-chunk debug artifacts."
     thresholds = {
         "ifi_typed_form_submission": {"within": 0.95, "from_start": 0.95},
         "bulk_scanned_batch": {"within": 0.75},
@@ -522,29 +716,119 @@ def enforce_attribution_thresholds(
             failures.append(
                 f"Attribution threshold failed for doc_type={doc_type}: "
                 f"chunk_scoped_field_rate={within_rate:.6f} < {threshold['within']:.2f}. "
-                f"See debug artifacts under {output_dir}."
+                f"{hint}"
             )
         if "from_start" in threshold and from_start_rate < threshold["from_start"]:
             failures.append(
                 f"Attribution threshold failed for doc_type={doc_type}: "
                 f"chunk_scoped_field_from_start_rate={from_start_rate:.6f} < {threshold['from_start']:.2f}. "
-                f"See debug artifacts under {output_dir}."
+                f"{hint}"
             )
     return failures
 
 
-def run_on_pdfs(
-    pdf_paths: List[Path],
+# Sources whose behaviour determines cached analysis/OCR output; editing them invalidates the cache.
+# schema.py defines DocClass, which is pickled inside DocumentAnalysis.
+_ANALYSIS_CACHE_SOURCES = (
+    REPO_ROOT / "pipeline" / "document_analysis.py",
+    REPO_ROOT / "pipeline" / "ocr.py",
+    REPO_ROOT / "pipeline" / "schema.py",
+)
+# OCR provider configuration: credentials select the Vision project/account the results came from.
+_ANALYSIS_CACHE_ENV = (
+    "GOOGLE_CLOUD_VISION_CREDENTIALS_B64",
+    "GOOGLE_APPLICATION_CREDENTIALS",
+    "GOOGLE_CLOUD_VISION_CREDENTIALS_JSON",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _analysis_code_stamp() -> str:
+    h = hashlib.sha256()
+    for src in _ANALYSIS_CACHE_SOURCES:
+        h.update(src.read_bytes())
+    h.update(repr(fitz.VersionBind).encode("utf-8"))
+    for name in _ANALYSIS_CACHE_ENV:
+        h.update(f"{name}={os.environ.get(name, '')}\0".encode("utf-8"))
+    return h.hexdigest()[:12]
+
+
+def _analysis_cache_path(cache_dir: Path, submission_id: str, ocr_provider: str, entry: str) -> Path:
+    return cache_dir / f"{submission_id}_{ocr_provider}_{entry}_{_analysis_code_stamp()}.pkl"
+
+
+def _load_cache_entry(cache_path: Path | None):
+    if cache_path is None or not cache_path.is_file():
+        return None
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return None  # unreadable entry: recompute and overwrite
+
+
+def _store_cache_entry(cache_path: Path | None, value) -> None:
+    if cache_path is None:
+        return
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+
+
+def _analyze_and_ocr(
+    pdf_path: Path,
+    submission_id: str,
     mode: str,
     ocr_provider: str,
-    output_dir: Path,
-    debug_doc: str | None = None,
-):
+    cache_dir: Path | None = None,
+) -> tuple[DocumentAnalysis, list[dict], int]:
     """
-    Run harness on a list of PDFs.
-    mode: "current" or "legacy_page1"
+    Return (analysis, per_page_stats, ocr_page_count) for a PDF in the given mode.
+    With cache_dir set, the analysis is pickled once per (content hash, provider, code stamp)
+    and shared by every mode; page text/OCR is pickled per page selection. Each load
+    unpickles a fresh copy, so legacy_page1's in-place edits never leak into the entry.
     """
-    summary = {
+    doc_pages_for_ocr = [0] if mode == "legacy_page1" else None
+    analysis_path = pages_path = None
+    if cache_dir is not None:
+        analysis_path = _analysis_cache_path(cache_dir, submission_id, ocr_provider, "analysis")
+        pages_path = _analysis_cache_path(
+            cache_dir, submission_id, ocr_provider, "page1" if doc_pages_for_ocr else "allpages"
+        )
+
+    analysis = _load_cache_entry(analysis_path)
+    if analysis is None:
+        analysis = analyze_document(str(pdf_path), ocr_provider_name=ocr_provider)
+        _store_cache_entry(analysis_path, analysis)
+
+    pages = _load_cache_entry(pages_path)
+    if pages is None:
+        # Typed form submissions (native_text): use text layer only, no OCR
+        if analysis.format == "native_text":
+            pages = extract_pdf_text_layer(
+                str(pdf_path),
+                pages=doc_pages_for_ocr,
+                mode="full",
+                include_text=True,
+            )
+        else:
+            pages = ocr_pdf_pages(
+                str(pdf_path),
+                pages=doc_pages_for_ocr,
+                mode="full",
+                provider_name=ocr_provider,
+                include_text=True,
+            )
+        _store_cache_entry(pages_path, pages)
+    per_page_stats, doc_ocr_pages = pages
+    return analysis, per_page_stats, doc_ocr_pages
+
+
+def _new_run_summary(mode: str) -> dict:
+    """Counters accumulated per doc; rates and other derived metrics are added by run_on_pdfs."""
+    return {
         "mode": mode,
         "total_docs": 0,
         "multi_docs": 0,
@@ -554,145 +838,144 @@ def run_on_pdfs(
         "ocr_low_confidence_docs": 0,
         "template_blocked_low_conf_count": 0,
         "total_ocr_pages": 0,
-        "avg_pages_per_doc": 0,
-        "reason_code_counts": {},
+        "reason_code_counts": Counter(),
         "false_empty_essay_count": 0,
         "docs_reviewed_count": 0,
-        "needs_review_rate": 0,
         "auto_approved_count": 0,
-        "auto_approve_rate": 0,
-        "ocr_low_confidence_rate": 0,
-        "ocr_confidence_avg": 0,
         "docs_with_any_text_count": 0,
-        "docs_with_any_text_rate": 0,
         "docs_with_grade_found_count": 0,
-        "docs_with_grade_found_rate": 0,
         "docs_with_school_found_count": 0,
-        "docs_with_school_found_rate": 0,
         "multi_expected_docs": 0,
         "multi_detected_docs": 0,
-        "multi_detection_rate": 0,
         "chunk_scoped_fields_total": 0,
         "chunk_scoped_fields_within_chunk": 0,
         "chunk_scoped_fields_from_start_page": 0,
-        "chunk_scoped_field_rate": 0,
-        "chunk_scoped_field_from_start_rate": 0,
-        "estimated_cost_proxy": 0,
         "review_rate_by_doc_type": {},
         "doc_type_distribution": {},
         "container_docs_count": 0,
         "skipped_container_docs": 0,
     }
+
+
+def _process_one_pdf(
+    pdf_path: Path,
+    mode: str,
+    ocr_provider: str,
+    docs_dir: Path,
+    debug_doc: str | None = None,
+    cache_dir: Path | None = None,
+    emit_attribution_artifacts: bool = False,
+) -> tuple[dict, List[str], dict[str, dict[str, int]], list[float]]:
+    """
+    Run the harness on one PDF. Returns this doc's partial summary, failures,
+    attribution counts by doc type and OCR confidence values for run_on_pdfs to fold.
+    Per-chunk attribution files are written only when emit_attribution_artifacts is set or
+    this is the debug doc; the same data is always in doc_summary.json's chunk_diagnostics.
+    """
+    summary = _new_run_summary(mode)
     failures: List[str] = []
     attribution_counts_by_doc_type: dict[str, dict[str, int]] = {}
     ocr_conf_values: list[float] = []
 
-    docs_dir = output_dir / "docs"
-    docs_dir.mkdir(parents=True, exist_ok=True)
+    submission_id = compute_submission_id(pdf_path)
+    doc_out_dir = docs_dir / submission_id
+    doc_out_dir.mkdir(parents=True, exist_ok=True)
 
-    for pdf_path in pdf_paths:
-        submission_id = compute_submission_id(pdf_path)
-        doc_out_dir = docs_dir / submission_id
-        doc_out_dir.mkdir(parents=True, exist_ok=True)
-
-        analysis = analyze_document(str(pdf_path), ocr_provider_name=ocr_provider)
-        if debug_doc and debug_doc.lower() in pdf_path.name.lower():
-            print(f"[debug-doc] {pdf_path.name}")
-            print(f"  structure={analysis.structure}")
-            print(f"  start_page_indices={analysis.start_page_indices}")
-            print(
-                "  chunk_ranges="
-                + str([{"start_page": c.start_page, "end_page": c.end_page} for c in analysis.chunk_ranges])
-            )
-
-        multi_peaks = analysis.page_count >= 6 and has_multiple_header_peaks(analysis)
-        if multi_peaks:
-            summary["multi_expected_docs"] += 1
-            if analysis.structure == "multi":
-                summary["multi_detected_docs"] += 1
-            else:
-                failures.append(
-                    f"Expected multi structure from header peaks but got {analysis.structure} for {pdf_path.name}"
-                )
+    analysis, per_page_stats, doc_ocr_pages = _analyze_and_ocr(
+        pdf_path, submission_id, mode, ocr_provider, cache_dir=cache_dir
+    )
+    is_debug_doc = bool(debug_doc) and debug_doc.lower() in pdf_path.name.lower()
+    emit_attribution_artifacts = emit_attribution_artifacts or is_debug_doc
+    if is_debug_doc:
+        print(f"[debug-doc] {pdf_path.name}")
+        print(f"  structure={analysis.structure}")
+        print(f"  start_page_indices={analysis.start_page_indices}")
+        print(
+            "  chunk_ranges="
+            + str([{"start_page": c.start_page, "end_page": c.end_page} for c in analysis.chunk_ranges])
+        )
 
-        if mode == "legacy_page1":
-            # Force single chunk on first page only
-            analysis.structure = "single"
-            analysis.chunk_ranges = [ChunkRange(start_page=0, end_page=0)]
-        else:
-            if analysis.structure == "multi":
-                summary["multi_docs"] += 1
-            if analysis.structure == "template":
-                summary["template_docs"] += 1
-        if getattr(analysis, "form_layout", "") == "ifi_official_typed":
-            summary["ifi_typed_form_docs"] += 1
-        if analysis.low_confidence_for_template:
-            summary["template_blocked_low_conf_count"] += 1
-
-        doc_reason_codes: set[str] = set()
-        doc_ocr_conf: list[dict] = []
-        chunk_count = 0
-        doc_ocr_pages = 0
-        chunk_diagnostics: list[dict] = []
-        doc_attr_telemetry_chunks: list[dict] = []
-        doc_attr_mismatch_count = 0
-        doc_attr_missing_count = 0
-        doc_attr_counts = {"total": 0, "within_chunk": 0, "from_start": 0}
-
-        doc_pages_for_ocr = [0] if mode == "legacy_page1" else None
-        # Typed form submissions (native_text): use text layer only, no OCR
-        if analysis.format == "native_text":
-            per_page_stats, doc_ocr_pages = extract_pdf_text_layer(
-                str(pdf_path),
-                pages=doc_pages_for_ocr,
-                mode="full",
-                include_text=True,
-            )
+    multi_peaks = analysis.page_count >= 6 and has_multiple_header_peaks(analysis)
+    if multi_peaks:
+        summary["multi_expected_docs"] += 1
+        if analysis.structure == "multi":
+            summary["multi_detected_docs"] += 1
         else:
-            per_page_stats, doc_ocr_pages = ocr_pdf_pages(
-                str(pdf_path),
-                pages=doc_pages_for_ocr,
-                mode="full",
-                provider_name=ocr_provider,
-                include_text=True,
-            )
-        expected_ocr_pages = 1 if mode == "legacy_page1" else analysis.page_count
-        if doc_ocr_pages != expected_ocr_pages:
-            failures.append(
-                f"OCR pages mismatch for {pdf_path.name}: expected={expected_ocr_pages} actual={doc_ocr_pages}"
-            )
-        page_indices = [int(s.get("page_index", -1)) for s in per_page_stats]
-        expected_indices = list(range(expected_ocr_pages))
-        if sorted(page_indices) != expected_indices:
             failures.append(
-                f"OCR page indices mismatch for {pdf_path.name}: expected={expected_indices} actual={sorted(page_indices)}"
+                f"Expected multi structure from header peaks but got {analysis.structure} for {pdf_path.name}"
             )
 
-        per_page_stats_sorted = sorted(per_page_stats, key=lambda x: int(x.get("page_index", 0)))
-        final_text = "\n\n".join((s.get("text") or "").strip() for s in per_page_stats_sorted if (s.get("text") or "").strip())
-        doc_ocr_conf = [
+    if mode == "legacy_page1":
+        # Force single chunk on first page only
+        analysis.structure = "single"
+        analysis.chunk_ranges = [ChunkRange(start_page=0, end_page=0)]
+    else:
+        if analysis.structure == "multi":
+            summary["multi_docs"] += 1
+        if analysis.structure == "template":
+            summary["template_docs"] += 1
+    if getattr(analysis, "form_layout", "") == "ifi_official_typed":
+        summary["ifi_typed_form_docs"] += 1
+    if analysis.low_confidence_for_template:
+        summary["template_blocked_low_conf_count"] += 1
+
+    chunk_count = 0
+    chunk_diagnostics: list[dict] = []
+    doc_attr_telemetry_chunks: list[dict] = []
+    doc_attr_mismatch_count = 0
+    doc_attr_missing_count = 0
+    doc_attr_counts = {"total": 0, "within_chunk": 0, "from_start": 0}
+
+    expected_ocr_pages = 1 if mode == "legacy_page1" else analysis.page_count
+    if doc_ocr_pages != expected_ocr_pages:
+        failures.append(
+            f"OCR pages mismatch for {pdf_path.name}: expected={expected_ocr_pages} actual={doc_ocr_pages}"
+        )
+    # Both producers return pages in requested order (ascending here), so no re-sort is needed;
+    # an out-of-order result is reported as an index mismatch.
+    page_indices = [s.get("page_index", -1) for s in per_page_stats]
+    expected_indices = list(range(expected_ocr_pages))
+    if page_indices != expected_indices:
+        failures.append(
+            f"OCR page indices mismatch for {pdf_path.name}: expected={expected_indices} actual={page_indices}"
+        )
+
+    # One pass over the page stats: stripped texts, per-page OCR conf rows and confidence values.
+    page_texts = []
+    doc_ocr_conf: list[dict] = []
+    for stat in per_page_stats:
+        t = (stat.get("text") or "").strip()
+        if t:
+            page_texts.append(t)
+        conf = stat.get("confidence_avg")
+        doc_ocr_conf.append(
             {
                 "page_index": int(stat.get("page_index", -1)),
-                "confidence_avg": stat.get("confidence_avg"),
+                "confidence_avg": conf,
                 "confidence_min": stat.get("confidence_min"),
                 "confidence_p10": stat.get("confidence_p10"),
                 "low_conf_page_count": stat.get("low_conf_page_count"),
                 "char_count": stat.get("char_count"),
             }
-            for stat in per_page_stats_sorted
-        ]
-        for stat in doc_ocr_conf:
-            conf = stat.get("confidence_avg")
-            if conf is not None:
-                try:
-                    ocr_conf_values.append(float(conf))
-                except (TypeError, ValueError):
-                    pass
-        if final_text.strip():
-            summary["docs_with_any_text_count"] += 1
-
-        # Prepare document
-        doc = fitz.open(pdf_path)
+        )
+        if conf is not None:
+            try:
+                ocr_conf_values.append(float(conf))
+            except (TypeError, ValueError):
+                pass
+    final_text = "\n\n".join(page_texts)
+    if page_texts:
+        summary["docs_with_any_text_count"] += 1
+
+    # Per-doc values passed to every chunk's pipeline run
+    doc_class_str = analysis.doc_class.value if hasattr(analysis.doc_class, "value") else str(analysis.doc_class)
+    chunk_analysis_structure = "single" if doc_class_str == "BULK_SCANNED_BATCH" else analysis.structure
+    header_signature_score_max = analysis.header_signature_score_max
+    chunk_count_total = len(analysis.chunk_ranges)
+
+    # Source document is opened once per doc and closed before the doc-level summary.
+    with fitz.open(pdf_path) as doc:
+        has_acroform = detect_pdf_has_acroform_fields(doc)
         for idx, chunk in enumerate(analysis.chunk_ranges):
             if mode == "legacy_page1":
                 from_page = 0
@@ -700,15 +983,21 @@ def run_on_pdfs(
             else:
                 from_page = chunk.start_page
                 to_page = chunk.end_page
-            chunk_doc = fitz.open()
-            chunk_doc.insert_pdf(doc, from_page=from_page, to_page=to_page, widgets=0)
-            tmp_chunk = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-            chunk_doc.save(tmp_chunk.name)
-            chunk_doc.close()
-
-            # Single-chunk: use original PDF so AcroForm widgets (Student's Name, School, Grade) are present
-            chunk_count_total = len(analysis.chunk_ranges)
-            pipeline_input_path = pdf_path if chunk_count_total == 1 else Path(tmp_chunk.name)
+            # Single-chunk: use original PDF so AcroForm widgets (Student's Name, School, Grade) are present.
+            # Only multi-chunk docs need a chunk PDF on disk (process_submission reads from a path).
+            tmp_chunk_path: Path | None = None
+            if chunk_count_total == 1:
+                pipeline_input_path = pdf_path
+            else:
+                chunk_doc = fitz.open()
+                # Nothing downstream reads link annotations; links=0 skips PyMuPDF's per-page link copy.
+                chunk_doc.insert_pdf(doc, from_page=from_page, to_page=to_page, widgets=0, links=0)
+                chunk_bytes = chunk_doc.tobytes()
+                chunk_doc.close()
+                with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_chunk:
+                    tmp_chunk.write(chunk_bytes)
+                tmp_chunk_path = Path(tmp_chunk.name)
+                pipeline_input_path = tmp_chunk_path
 
             rec, rep = run_chunk_pipeline(
                 idx,
@@ -722,16 +1011,9 @@ def run_on_pdfs(
                 chunk_page_end=to_page,
                 template_blocked_low_conf=analysis.low_confidence_for_template,
                 doc_class=analysis.doc_class,
-                analysis_structure=(
-                    "single"
-                    if (analysis.doc_class.value if hasattr(analysis.doc_class, "value") else str(analysis.doc_class))
-                    == "BULK_SCANNED_BATCH"
-                    else analysis.structure
-                ),
+                analysis_structure=chunk_analysis_structure,
                 analysis_form_layout=analysis.form_layout,
-                analysis_header_signature_score_max=max(
-                    (p.header_signature_score for p in analysis.pages), default=0.0
-                ),
+                analysis_header_signature_score_max=header_signature_score_max,
             )
             chunk_count += 1
             chunk_codes = _normalize_reason_codes(rec.review_reason_codes)
@@ -740,30 +1022,19 @@ def run_on_pdfs(
             rep_extracted = rep.get("extracted_fields", {})
             attr_pages = load_per_page_text(rep, artifact_dir="")
             if not attr_pages:
-                attr_pages = per_page_stats_sorted
-            rep_source_pages = compute_field_source_pages(
-                per_page_text=attr_pages,
-                extracted_fields=rep_extracted,
-                chunk_page_start=from_page,
-                chunk_page_end=to_page,
-            )
+                attr_pages = per_page_stats
+            # One attribution pass; source pages are its page_index projection.
             rep_attr_confidence = compute_field_attribution_confidence(
                 per_page_text=attr_pages,
                 extracted_fields=rep_extracted,
                 chunk_page_start=from_page,
                 chunk_page_end=to_page,
             )
+            rep_source_pages = field_source_pages_from_attribution(rep_attr_confidence)
+            # Chunk-scoped attribution counts; added to the summary's chunk_scoped_* totals after the loop.
             for field in ("student_name", "school_name", "grade"):
                 if rep_extracted.get(field) is not None:
-                    summary["chunk_scoped_fields_total"] += 1
                     source_page = rep_source_pages.get(field)
-                    if (
-                        source_page is not None
-                        and from_page <= source_page <= to_page
-                    ):
-                        summary["chunk_scoped_fields_within_chunk"] += 1
-                    if source_page == from_page:
-                        summary["chunk_scoped_fields_from_start_page"] += 1
                     doc_attr_counts["total"] += 1
                     if source_page is not None and from_page <= source_page <= to_page:
                         doc_attr_counts["within_chunk"] += 1
@@ -787,30 +1058,29 @@ def run_on_pdfs(
                 }
             )
 
-            chunk_artifact_dir = doc_out_dir / rec.submission_id
-            chunk_artifact_dir.mkdir(parents=True, exist_ok=True)
-            with open(chunk_artifact_dir / "field_source_pages.json", "w", encoding="utf-8") as f:
-                json.dump(
+            if emit_attribution_artifacts:
+                chunk_artifact_dir = doc_out_dir / rec.submission_id
+                chunk_artifact_dir.mkdir(parents=True, exist_ok=True)
+                _write_json(
+                    chunk_artifact_dir / "field_source_pages.json",
                     {
                         "chunk_submission_id": rec.submission_id,
                         "chunk_page_start": from_page,
                         "chunk_page_end": to_page,
                         "field_source_pages": rep_source_pages,
                     },
-                    f,
-                    indent=2,
                 )
-            write_field_attribution_debug_artifact(
-                chunk_artifact_dir=chunk_artifact_dir,
-                submission_id=submission_id,
-                chunk_submission_id=rec.submission_id,
-                doc_type=chunk_doc_type,
-                chunk_page_start=from_page,
-                chunk_page_end=to_page,
-                extracted_fields=rep_extracted,
-                field_source_pages=rep_source_pages,
-                per_page_text=attr_pages,
-            )
+                write_field_attribution_debug_artifact(
+                    chunk_artifact_dir=chunk_artifact_dir,
+                    submission_id=submission_id,
+                    chunk_submission_id=rec.submission_id,
+                    doc_type=chunk_doc_type,
+                    chunk_page_start=from_page,
+                    chunk_page_end=to_page,
+                    extracted_fields=rep_extracted,
+                    field_source_pages=rep_source_pages,
+                    per_page_text=attr_pages,
+                )
             chunk_diagnostics.append(
                 {
                     "chunk_index": idx,
@@ -833,140 +1103,224 @@ def run_on_pdfs(
                 failures.append(
                     f"Invariant violated: chunk needs_review=True with empty reason codes ({pdf_path.name} chunk {idx})."
                 )
-            if debug_doc and debug_doc.lower() in pdf_path.name.lower():
+            if is_debug_doc:
                 print(
                     f"  chunk[{idx}] start_page={from_page} "
                     f"student={rep_extracted.get('student_name')!r}@{rep_source_pages.get('student_name')} "
                     f"grade={rep_extracted.get('grade')!r}@{rep_source_pages.get('grade')} "
                     f"school={rep_extracted.get('school_name')!r}@{rep_source_pages.get('school_name')}"
                 )
-            try:
-                Path(tmp_chunk.name).unlink()
-            except Exception:
-                pass
-        doc.close()
-
-        extracted = extract_doc_fields_from_final_text(final_text)
-        doc_type = route_doc_type(
-            analysis,
-            final_text,
-            has_acroform=detect_pdf_has_acroform_fields(str(pdf_path)),
-        )
-        doc_role = classify_doc_role(
-            {
-                "doc_type": doc_type,
-                "doc_class": analysis.doc_class,
-                "analysis_structure": analysis.structure,
-                "chunk_index": None,
-            },
-            {"analysis": {"structure": analysis.structure}},
-            chunk_metadata=None,
-        )
-        summary["doc_type_distribution"][doc_type] = summary["doc_type_distribution"].get(doc_type, 0) + 1
-        type_counts = attribution_counts_by_doc_type.setdefault(
-            doc_type, {"total": 0, "within_chunk": 0, "from_start": 0}
-        )
-        type_counts["total"] += doc_attr_counts["total"]
-        type_counts["within_chunk"] += doc_attr_counts["within_chunk"]
-        type_counts["from_start"] += doc_attr_counts["from_start"]
-        # Merge pipeline chunk results so missing-metadata flags use pipeline findings
-        for diag in chunk_diagnostics:
-            ef = diag.get("extracted_fields") or {}
-            for field in ("student_name", "school_name", "grade"):
-                val = ef.get(field)
-                if val and not extracted.get(field):
-                    if field == "school_name" and looks_like_essay_fragment(val):
-                        continue  # Don't use essay text as school name
-                    extracted[field] = val
-        if extracted.get("grade"):
-            summary["docs_with_grade_found_count"] += 1
-        if extracted.get("school_name"):
-            summary["docs_with_school_found_count"] += 1
-
-        _, missing_field_evidence = compute_doc_reason_codes(
-            extracted=extracted,
-            final_text=final_text,
-            submission_id=submission_id,
-            is_template_doc=(analysis.structure == "template"),
-            template_blocked_low_conf=analysis.low_confidence_for_template,
-        )
-        # Parent status must derive from children (logical OR) to prevent silent success masking child failures.
-        doc_needs_review, doc_reason_codes = aggregate_parent_status_from_children(chunk_diagnostics)
-        is_container_parent = doc_role == DocRole.CONTAINER
-        if doc_needs_review and not doc_reason_codes:
-            failures.append(f"Invariant violated: needs_review=True with empty reason codes ({pdf_path.name})")
-
-        summary["chunks_total"] += chunk_count
-        summary["total_ocr_pages"] += doc_ocr_pages if doc_ocr_pages > 0 else expected_ocr_pages
-        apply_doc_review_metrics(
-            summary,
-            doc_role=doc_role,
-            doc_type=doc_type,
-            doc_needs_review=doc_needs_review,
-            doc_reason_codes=doc_reason_codes,
-            failures=failures,
-            pdf_name=pdf_path.name,
-        )
+            if tmp_chunk_path is not None:
+                try:
+                    tmp_chunk_path.unlink()
+                except Exception:
+                    pass
 
-        # doc summary
-        # Special assertion for Valeria-Pantoja to ensure multi detection with full OCR
-        if pdf_path.name.lower().startswith("valeria-pantoja") and mode == "current":
-            if analysis.structure != "multi" or chunk_count <= 1:
-                failures.append("Valeria-Pantoja expected multi structure in current mode.")
-        doc_summary = {
-            "submission_id": submission_id,
-            "filename": pdf_path.name,
-            "page_count": analysis.page_count,
-            "format": analysis.format,
-            "structure": analysis.structure,
-            "form_layout": getattr(analysis, "form_layout", "unknown"),
-            "doc_class": analysis.doc_class.value if hasattr(analysis.doc_class, "value") else str(analysis.doc_class),
-            "chunk_count": chunk_count,
-            "needs_review": doc_needs_review,
-            "reason_codes": sorted(list(doc_reason_codes)),
+    extracted = extract_doc_fields_from_final_text(final_text)
+    doc_type = route_doc_type(
+        analysis,
+        final_text,
+        has_acroform=has_acroform,
+    )
+    doc_role = classify_doc_role(
+        {
             "doc_type": doc_type,
-            "doc_role": doc_role.value,
-            "extracted": extracted,
-            "missing_field_evidence": missing_field_evidence,
-            "chunk_diagnostics": chunk_diagnostics,
-            "attribution_telemetry": {
-                "chunks": doc_attr_telemetry_chunks,
-            },
-            "attribution_mismatch_count": doc_attr_mismatch_count,
-            "attribution_missing_count": doc_attr_missing_count,
-            "ocr_conf_stats": doc_ocr_conf,
-            "total_ocr_pages": doc_ocr_pages if doc_ocr_pages > 0 else expected_ocr_pages,
-            "final_text_char_count": len(final_text),
-        }
-        with open(doc_out_dir / "doc_summary.json", "w", encoding="utf-8") as f:
-            json.dump(doc_summary, f, indent=2)
+            "doc_class": analysis.doc_class,
+            "analysis_structure": analysis.structure,
+            "chunk_index": None,
+        },
+        {"analysis": {"structure": analysis.structure}},
+        chunk_metadata=None,
+    )
+    # Partials cover a single doc (run_on_pdfs sums them), so these per-type entries start fresh.
+    summary["doc_type_distribution"][doc_type] = 1
+    attribution_counts_by_doc_type[doc_type] = dict(doc_attr_counts)
+    summary["chunk_scoped_fields_total"] += doc_attr_counts["total"]
+    summary["chunk_scoped_fields_within_chunk"] += doc_attr_counts["within_chunk"]
+    summary["chunk_scoped_fields_from_start_page"] += doc_attr_counts["from_start"]
+    # Merge pipeline chunk results so missing-metadata flags use pipeline findings
+    missing_fields = [f for f in ("student_name", "school_name", "grade") if not extracted.get(f)]
+    for diag in chunk_diagnostics:
+        if not missing_fields:
+            break
+        ef = diag.get("extracted_fields") or {}
+        for field in tuple(missing_fields):
+            val = ef.get(field)
+            if not val:
+                continue
+            if field == "school_name" and looks_like_essay_fragment(val):
+                continue  # Don't use essay text as school name
+            extracted[field] = val
+            missing_fields.remove(field)
+    if extracted.get("grade"):
+        summary["docs_with_grade_found_count"] += 1
+    if extracted.get("school_name"):
+        summary["docs_with_school_found_count"] += 1
+
+    _, missing_field_evidence = compute_doc_reason_codes(
+        extracted=extracted,
+        final_text=final_text,
+        submission_id=submission_id,
+        is_template_doc=(analysis.structure == "template"),
+        template_blocked_low_conf=analysis.low_confidence_for_template,
+    )
+    # Parent status must derive from children (logical OR) to prevent silent success masking child failures.
+    doc_needs_review, doc_reason_codes = aggregate_parent_status_from_children(chunk_diagnostics)
+    # Sorted once: stable JSON output and deterministic reason_code_counts insertion order.
+    sorted_codes = sorted(doc_reason_codes)
+    is_container_parent = doc_role == DocRole.CONTAINER
+    if doc_needs_review and not doc_reason_codes:
+        failures.append(f"Invariant violated: needs_review=True with empty reason codes ({pdf_path.name})")
+
+    summary["chunks_total"] += chunk_count
+    summary["total_ocr_pages"] += doc_ocr_pages if doc_ocr_pages > 0 else expected_ocr_pages
+    apply_doc_review_metrics(
+        summary,
+        doc_role=doc_role,
+        doc_type=doc_type,
+        doc_needs_review=doc_needs_review,
+        doc_reason_codes=sorted_codes,
+        failures=failures,
+        pdf_name=pdf_path.name,
+    )
 
-    # Rates and derived metrics
-    effective_docs = summary["total_docs"]
-    if summary["total_docs"] > 0:
-        summary["avg_pages_per_doc"] = summary["total_ocr_pages"] / summary["total_docs"]
-        if effective_docs > 0:
-            summary["needs_review_rate"] = summary["docs_reviewed_count"] / effective_docs
-            summary["auto_approve_rate"] = summary["auto_approved_count"] / effective_docs
+    # doc summary
+    # Special assertion for Valeria-Pantoja to ensure multi detection with full OCR
+    if pdf_path.name.lower().startswith("valeria-pantoja") and mode == "current":
+        if analysis.structure != "multi" or chunk_count <= 1:
+            failures.append("Valeria-Pantoja expected multi structure in current mode.")
+    doc_summary = {
+        "submission_id": submission_id,
+        "filename": pdf_path.name,
+        "page_count": analysis.page_count,
+        "format": analysis.format,
+        "structure": analysis.structure,
+        "form_layout": getattr(analysis, "form_layout", "unknown"),
+        "doc_class": doc_class_str,
+        "chunk_count": chunk_count,
+        "needs_review": doc_needs_review,
+        "reason_codes": sorted_codes,
+        "doc_type": doc_type,
+        "doc_role": doc_role.value,
+        "extracted": extracted,
+        "missing_field_evidence": missing_field_evidence,
+        "chunk_diagnostics": chunk_diagnostics,
+        "attribution_telemetry": {
+            "chunks": doc_attr_telemetry_chunks,
+        },
+        "attribution_mismatch_count": doc_attr_mismatch_count,
+        "attribution_missing_count": doc_attr_missing_count,
+        "ocr_conf_stats": doc_ocr_conf,
+        "total_ocr_pages": doc_ocr_pages if doc_ocr_pages > 0 else expected_ocr_pages,
+        "final_text_char_count": len(final_text),
+    }
+    _write_json(doc_out_dir / "doc_summary.json", doc_summary, atomic=True)
+
+    return summary, failures, attribution_counts_by_doc_type, ocr_conf_values
+
+
+def _merge_counts(into: dict, part: dict) -> None:
+    """Add numeric counters from part into into, recursing into nested count dicts."""
+    for key, val in part.items():
+        if isinstance(val, dict):
+            _merge_counts(into.setdefault(key, {}), val)
+        elif isinstance(val, (int, float)) and not isinstance(val, bool):
+            into[key] = into.get(key, 0) + val
+
+
+_BATCH_WAL_NAME = "batch_summary.wal.ndjson"
+
+
+def _write_batch_summary(output_dir: Path, name: str, summary: dict) -> None:
+    """Write a run_on_pdfs batch summary atomically, then drop the progress log it supersedes."""
+    _write_json(output_dir / name, summary, atomic=True)
+    (output_dir / _BATCH_WAL_NAME).unlink(missing_ok=True)
+
+
+def run_on_pdfs(
+    pdf_paths: List[Path],
+    mode: str,
+    ocr_provider: str,
+    output_dir: Path,
+    debug_doc: str | None = None,
+    cache_dir: Path | None = None,
+    emit_attribution_artifacts: bool = False,
+):
+    """
+    Run harness on a list of PDFs.
+    mode: "current" or "legacy_page1"
+    cache_dir: reuse analysis/OCR results pickled here by earlier runs (and by the other mode); None disables.
+    emit_attribution_artifacts: write per-chunk field_source_pages.json / field_attribution_debug.json
+        for every doc (otherwise only for the --debug-doc match).
+    """
+    summary = _new_run_summary(mode)
+    failures: List[str] = []
+    attribution_counts_by_doc_type: dict[str, dict[str, int]] = {}
+    ocr_conf_values: list[float] = []
+
+    docs_dir = output_dir / "docs"
+    docs_dir.mkdir(parents=True, exist_ok=True)
+
+    # Docs are independent; fan out across processes unless debug output must stay ordered.
+    process_one = functools.partial(
+        _process_one_pdf,
+        mode=mode,
+        ocr_provider=ocr_provider,
+        docs_dir=docs_dir,
+        debug_doc=debug_doc,
+        cache_dir=cache_dir,
+        emit_attribution_artifacts=emit_attribution_artifacts,
+    )
+    # Per-doc progress log: one NDJSON line per finished doc, so a killed run still shows
+    # what completed (tail -f friendly). Left in place for main; _write_batch_summary removes
+    # it only after the batch summary file is on disk.
+    wal_path = output_dir / _BATCH_WAL_NAME
+
+    def fold(wal, pdf_path: Path, result) -> None:
+        doc_summary_part, doc_failures, doc_attr_counts_by_type, doc_conf_values = result
+        _merge_counts(summary, doc_summary_part)
+        failures.extend(doc_failures)
+        _merge_counts(attribution_counts_by_doc_type, doc_attr_counts_by_type)
+        ocr_conf_values.extend(doc_conf_values)
+        entry = {"pdf": pdf_path.name, "delta": doc_summary_part, "failures": doc_failures}
+        wal.write(orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS) + b"\n")
+        wal.flush()
+
+    max_workers = min(8, os.cpu_count() or 1, len(pdf_paths))
+    # Fold in input order (ex.map yields in order) so failures and dict key order match a serial run.
+    with open(wal_path, "wb") as wal:
+        if max_workers > 1 and not debug_doc:
+            with ProcessPoolExecutor(max_workers=max_workers) as ex:
+                for pdf_path, result in zip(pdf_paths, ex.map(process_one, pdf_paths)):
+                    fold(wal, pdf_path, result)
         else:
-            summary["needs_review_rate"] = 0
-            summary["auto_approve_rate"] = 0
-        summary["ocr_low_confidence_rate"] = summary["ocr_low_confidence_docs"] / summary["total_docs"]
-        summary["docs_with_any_text_rate"] = summary["docs_with_any_text_count"] / summary["total_docs"]
-        summary["docs_with_grade_found_rate"] = summary["docs_with_grade_found_count"] / summary["total_docs"]
-        summary["docs_with_school_found_rate"] = summary["docs_with_school_found_count"] / summary["total_docs"]
-        if summary["multi_expected_docs"] > 0:
-            summary["multi_detection_rate"] = summary["multi_detected_docs"] / summary["multi_expected_docs"]
-        if summary["chunk_scoped_fields_total"] > 0:
-            summary["chunk_scoped_field_rate"] = (
-                summary["chunk_scoped_fields_within_chunk"] / summary["chunk_scoped_fields_total"]
-            )
-            summary["chunk_scoped_field_from_start_rate"] = (
-                summary["chunk_scoped_fields_from_start_page"] / summary["chunk_scoped_fields_total"]
-            )
+            for pdf_path in pdf_paths:
+                fold(wal, pdf_path, process_one(pdf_path))
+
+    # Rates and derived metrics (0 when the denominator is empty)
+    total_docs = summary["total_docs"]
+    has_docs = total_docs > 0
+    scoped_total = summary["chunk_scoped_fields_total"] if has_docs else 0
+    summary["avg_pages_per_doc"] = summary["total_ocr_pages"] / total_docs if has_docs else 0
+    summary["needs_review_rate"] = summary["docs_reviewed_count"] / total_docs if has_docs else 0
+    summary["auto_approve_rate"] = summary["auto_approved_count"] / total_docs if has_docs else 0
+    summary["ocr_low_confidence_rate"] = summary["ocr_low_confidence_docs"] / total_docs if has_docs else 0
+    summary["docs_with_any_text_rate"] = summary["docs_with_any_text_count"] / total_docs if has_docs else 0
+    summary["docs_with_grade_found_rate"] = summary["docs_with_grade_found_count"] / total_docs if has_docs else 0
+    summary["docs_with_school_found_rate"] = summary["docs_with_school_found_count"] / total_docs if has_docs else 0
+    summary["multi_detection_rate"] = (
+        summary["multi_detected_docs"] / summary["multi_expected_docs"]
+        if has_docs and summary["multi_expected_docs"] > 0
+        else 0
+    )
+    summary["chunk_scoped_field_rate"] = (
+        summary["chunk_scoped_fields_within_chunk"] / scoped_total if scoped_total else 0
+    )
+    summary["chunk_scoped_field_from_start_rate"] = (
+        summary["chunk_scoped_fields_from_start_page"] / scoped_total if scoped_total else 0
+    )
     summary["estimated_cost_proxy"] = summary["total_ocr_pages"]
-    if ocr_conf_values:
-        summary["ocr_confidence_avg"] = sum(ocr_conf_values) / len(ocr_conf_values)
+    summary["ocr_confidence_avg"] = sum(ocr_conf_values) / len(ocr_conf_values) if ocr_conf_values else 0
     for doc_type, bucket in summary["review_rate_by_doc_type"].items():
         total = bucket.get("total", 0)
         bucket["review_rate"] = (bucket.get("needs_review", 0) / total) if total else 0
@@ -977,37 +1331,68 @@ def run_on_pdfs(
                 f"Doc-level reason count exceeds total_docs for {code}: count={count} total_docs={summary['total_docs']}"
             )
 
-    failures.extend(enforce_attribution_thresholds(attribution_counts_by_doc_type, output_dir))
+    failures.extend(
+        enforce_attribution_thresholds(
+            attribution_counts_by_doc_type,
+            output_dir,
+            attribution_artifacts_emitted=emit_attribution_artifacts,
+        )
+    )
     return summary, failures
 
 
+def _read_doc_summary(path: Path) -> dict | None:
+    try:
+        return orjson.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+
+
+def _load_doc_summaries(docs_dir: Path) -> Dict[str, dict]:
+    """
+    Load docs_dir/<submission_id>/doc_summary.json for every doc, keyed by submission id.
+    Directory order matches docs_dir.glob("*/doc_summary.json"); reads run on a small thread pool.
+    """
+    with os.scandir(docs_dir) as it:
+        paths = [
+            Path(entry.path) / "doc_summary.json"
+            for entry in it
+            if not entry.name.startswith(".") and entry.is_dir()
+        ]
+    if not paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(16, len(paths))) as ex:
+        loaded = list(ex.map(_read_doc_summary, paths))
+    return {path.parent.name: doc for path, doc in zip(paths, loaded) if doc is not None}
+
+
 def compare_summaries(current: dict, legacy: dict, docs_current: Path, docs_legacy: Path, output_path: Path):
     """Create before/after comparison report using batch and per-doc summaries."""
     def delta(a, b):
         return a - b
 
-    reason_codes = set(current.get("reason_code_counts", {}).keys()) | set(legacy.get("reason_code_counts", {}).keys())
+    current_counts = Counter(current.get("reason_code_counts", {}))
+    legacy_counts = Counter(legacy.get("reason_code_counts", {}))
     reason_delta = {}
-    for code in sorted(reason_codes):
+    for code in sorted(current_counts.keys() | legacy_counts.keys()):
         reason_delta[code] = {
-            "current": current.get("reason_code_counts", {}).get(code, 0),
-            "legacy": legacy.get("reason_code_counts", {}).get(code, 0),
-            "delta": current.get("reason_code_counts", {}).get(code, 0) - legacy.get("reason_code_counts", {}).get(code, 0),
+            "current": current_counts[code],
+            "legacy": legacy_counts[code],
+            "delta": current_counts[code] - legacy_counts[code],
         }
 
+    # Each docs dir is scanned and loaded once; both sections below reuse the loaded summaries.
+    current_docs = _load_doc_summaries(docs_current) if docs_current.exists() else {}
+    legacy_docs = _load_doc_summaries(docs_legacy) if docs_legacy.exists() else {}
+
     # Most improved docs: EMPTY_ESSAY in legacy but not in current
     improved = []
     if docs_current.exists() and docs_legacy.exists():
-        for legacy_doc in docs_legacy.glob("*/doc_summary.json"):
-            with open(legacy_doc, "r", encoding="utf-8") as f:
-                ldoc = json.load(f)
+        for sid, ldoc in legacy_docs.items():
             if "EMPTY_ESSAY" not in ldoc.get("reason_codes", []):
                 continue
-            sid = legacy_doc.parent.name
-            current_doc_path = docs_current / sid / "doc_summary.json"
-            if current_doc_path.exists():
-                with open(current_doc_path, "r", encoding="utf-8") as f:
-                    cdoc = json.load(f)
+            cdoc = current_docs.get(sid)
+            if cdoc is not None:
                 if "EMPTY_ESSAY" not in cdoc.get("reason_codes", []):
                     improved.append({"submission_id": sid, "filename": cdoc.get("filename"), "legacy_reason_codes": ldoc.get("reason_codes"), "current_reason_codes": cdoc.get("reason_codes")})
     improved = improved[:10]
@@ -1015,13 +1400,15 @@ def compare_summaries(current: dict, legacy: dict, docs_current: Path, docs_lega
     # Cost drivers: top 10 docs by total_ocr_pages in current
     cost_drivers = []
     if docs_current.exists():
-        docs_list = []
-        for doc_path in docs_current.glob("*/doc_summary.json"):
-            with open(doc_path, "r", encoding="utf-8") as f:
-                doc = json.load(f)
-            docs_list.append({"submission_id": doc_path.parent.name, "filename": doc.get("filename"), "total_ocr_pages": doc.get("total_ocr_pages", 0)})
-        docs_list.sort(key=lambda x: x["total_ocr_pages"], reverse=True)
-        cost_drivers = docs_list[:10]
+        # nlargest keeps sorted(..., reverse=True)[:10] tie order without sorting every doc.
+        cost_drivers = heapq.nlargest(
+            10,
+            (
+                {"submission_id": sid, "filename": doc.get("filename"), "total_ocr_pages": doc.get("total_ocr_pages", 0)}
+                for sid, doc in current_docs.items()
+            ),
+            key=lambda x: x["total_ocr_pages"],
+        )
 
     report = {
         "false_empty_essay_delta": delta(current.get("false_empty_essay_count", 0), legacy.get("false_empty_essay_count", 0)),
@@ -1036,8 +1423,7 @@ def compare_summaries(current: dict, legacy: dict, docs_current: Path, docs_lega
         "cost_drivers": cost_drivers,
     }
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2)
+    _write_json(output_path, report)
 
 
 def main() -> int:
@@ -1057,6 +1443,14 @@ def main() -> int:
     parser.add_argument("--output-dir", type=Path, help="Output directory for harness artifacts")
     parser.add_argument("--debug-doc", help="Print detailed chunk extraction debug for matching filename")
     parser.add_argument("--simulate-legacy-page1", action="store_true", help="Also run legacy page-1-only mode and compare")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Recompute analysis/OCR instead of reusing output-dir/.cache"
+    )
+    parser.add_argument(
+        "--emit-attribution-artifacts",
+        action="store_true",
+        help="Write per-chunk field_source_pages.json and field_attribution_debug.json for every doc",
+    )
     parser.add_argument("--compare-to", type=Path, help="Optional baseline run_snapshot.json for drift comparison")
     args = parser.parse_args()
 
@@ -1072,26 +1466,31 @@ def main() -> int:
             return 1
         out_base = args.output_dir or (REPO_ROOT / "artifacts" / "harness_runs" / time.strftime("%Y%m%d_%H%M%S"))
         out_base.mkdir(parents=True, exist_ok=True)
+        # Shared by both modes so legacy_page1 reuses the current run's analysis.
+        cache_dir = None if args.no_cache else out_base / ".cache"
 
         # Current mode
         current_dir = out_base / "current"
         current_dir.mkdir(parents=True, exist_ok=True)
         current_summary, failures_current = run_on_pdfs(
-            pdf_paths, "current", args.ocr_provider, current_dir, debug_doc=args.debug_doc
+            pdf_paths,
+            "current",
+            args.ocr_provider,
+            current_dir,
+            debug_doc=args.debug_doc,
+            cache_dir=cache_dir,
+            emit_attribution_artifacts=args.emit_attribution_artifacts,
         )
-        with open(current_dir / "batch_summary.current.json", "w", encoding="utf-8") as f:
-            json.dump(current_summary, f, indent=2)
+        _write_batch_summary(current_dir, "batch_summary.current.json", current_summary)
         current_snapshot = build_run_snapshot(current_summary)
-        with open(current_dir / "run_snapshot.json", "w", encoding="utf-8") as f:
-            json.dump(current_snapshot, f, indent=2)
+        _write_json(current_dir / "run_snapshot.json", current_snapshot, atomic=True)
 
         all_failures = list(failures_current)
         if args.compare_to:
             with open(args.compare_to, "r", encoding="utf-8") as f:
                 baseline_snapshot = json.load(f)
             ok, drift_report = compare_snapshots(current_snapshot, baseline_snapshot)
-            with open(out_base / "drift_report.json", "w", encoding="utf-8") as f:
-                json.dump(drift_report, f, indent=2)
+            _write_json(out_base / "drift_report.json", drift_report)
             if not ok:
                 all_failures.extend(drift_report.get("issues", []))
         # Typed-form tc01–tc08: missing fields must be flagged for review, never fail; record always produced.
@@ -1103,10 +1502,15 @@ def main() -> int:
             legacy_dir = out_base / "legacy"
             legacy_dir.mkdir(parents=True, exist_ok=True)
             legacy_summary, failures_legacy = run_on_pdfs(
-                pdf_paths, "legacy_page1", args.ocr_provider, legacy_dir, debug_doc=args.debug_doc
+                pdf_paths,
+                "legacy_page1",
+                args.ocr_provider,
+                legacy_dir,
+                debug_doc=args.debug_doc,
+                cache_dir=cache_dir,
+                emit_attribution_artifacts=args.emit_attribution_artifacts,
             )
-            with open(legacy_dir / "batch_summary.legacy.json", "w", encoding="utf-8") as f:
-                json.dump(legacy_summary, f, indent=2)
+            _write_batch_summary(legacy_dir, "batch_summary.legacy.json", legacy_summary)
             all_failures.extend(failures_legacy)
 
             compare_summaries(
@@ -1148,7 +1552,7 @@ def main() -> int:
         "template_blocked_low_conf_count": 0,
         "total_ocr_pages": 0,
         "avg_pages_per_doc": 0,
-        "reason_code_counts": {},
+        "reason_code_counts": Counter(),
         "false_empty_essay_count": 0,
     }
 
@@ -1180,17 +1584,13 @@ def main() -> int:
             doc_class=multi_analysis.doc_class,
             analysis_structure=multi_analysis.structure,
             analysis_form_layout=multi_analysis.form_layout,
-            analysis_header_signature_score_max=max(
-                (p.header_signature_score for p in multi_analysis.pages), default=0.0
-            ),
+            analysis_header_signature_score_max=multi_analysis.header_signature_score_max,
         )
+        rec_codes = _normalize_reason_codes(rec.review_reason_codes)
         summary["chunks_total"] += 1
-        if "EMPTY_ESSAY" in rec.review_reason_codes:
+        if "EMPTY_ESSAY" in rec_codes:
             summary["false_empty_essay_count"] += 1
-        for code in _normalize_reason_codes(rec.review_reason_codes):
-            summary["reason_code_counts"][code] = summary["reason_code_counts"].get(code, 0) + 1
-            if "=" in code or code not in ALLOWED_REASON_CODES:
-                failures.append(f"Reason code not enum: {code}")
+        _tally_reason_codes(rec_codes, summary["reason_code_counts"], failures)
 
     # TEST 2: Template-only
     template_analysis = analyze_document(str(fixtures["template"]), ocr_provider_name=args.ocr_provider)
@@ -1210,16 +1610,12 @@ def main() -> int:
         doc_class=template_analysis.doc_class,
         analysis_structure=template_analysis.structure,
         analysis_form_layout=template_analysis.form_layout,
-        analysis_header_signature_score_max=max(
-            (p.header_signature_score for p in template_analysis.pages), default=0.0
-        ),
+        analysis_header_signature_score_max=template_analysis.header_signature_score_max,
     )
-    if "TEMPLATE_ONLY" not in rec.review_reason_codes:
+    rec_codes = _normalize_reason_codes(rec.review_reason_codes)
+    if "TEMPLATE_ONLY" not in rec_codes:
         failures.append("Template record missing TEMPLATE_ONLY code.")
-    for code in _normalize_reason_codes(rec.review_reason_codes):
-        summary["reason_code_counts"][code] = summary["reason_code_counts"].get(code, 0) + 1
-        if "=" in code or code not in ALLOWED_REASON_CODES:
-            failures.append(f"Reason code not enum: {code}")
+    _tally_reason_codes(rec_codes, summary["reason_code_counts"], failures)
     if template_analysis.low_confidence_for_template:
         summary["template_blocked_low_conf_count"] += 1
 
@@ -1239,19 +1635,15 @@ def main() -> int:
         doc_class=scanned_analysis.doc_class,
         analysis_structure=scanned_analysis.structure,
         analysis_form_layout=scanned_analysis.form_layout,
-        analysis_header_signature_score_max=max(
-            (p.header_signature_score for p in scanned_analysis.pages), default=0.0
-        ),
+        analysis_header_signature_score_max=scanned_analysis.header_signature_score_max,
     )
+    rec_codes = _normalize_reason_codes(rec.review_reason_codes)
     ocr_summary = report.get("ocr_summary", {})
     if ocr_summary.get("confidence_min") is None or ocr_summary.get("confidence_p10") is None:
         failures.append("OCR confidence stats missing for scanned doc.")
-    if "OCR_LOW_CONFIDENCE" in rec.review_reason_codes:
+    if "OCR_LOW_CONFIDENCE" in rec_codes:
         summary["ocr_low_confidence_docs"] += 1
-    for code in _normalize_reason_codes(rec.review_reason_codes):
-        summary["reason_code_counts"][code] = summary["reason_code_counts"].get(code, 0) + 1
-        if "=" in code or code not in ALLOWED_REASON_CODES:
-            failures.append(f"Reason code not enum: {code}")
+    _tally_reason_codes(rec_codes, summary["reason_code_counts"], failures)
 
     # TEST 4: Hybrid synthetic
     hybrid_analysis = analyze_document(str(hybrid_path), ocr_provider_name=args.ocr_provider)
@@ -1269,67 +1661,50 @@ def main() -> int:
         doc_class=hybrid_analysis.doc_class,
         analysis_structure=hybrid_analysis.structure,
         analysis_form_layout=hybrid_analysis.form_layout,
-        analysis_header_signature_score_max=max(
-            (p.header_signature_score for p in hybrid_analysis.pages), default=0.0
-        ),
+        analysis_header_signature_score_max=hybrid_analysis.header_signature_score_max,
     )
+    rec_codes = _normalize_reason_codes(rec.review_reason_codes)
     if rec.word_count == 0:
         failures.append("Hybrid chunk produced EMPTY_ESSAY.")
-    for code in _normalize_reason_codes(rec.review_reason_codes):
-        summary["reason_code_counts"][code] = summary["reason_code_counts"].get(code, 0) + 1
-        if "=" in code or code not in ALLOWED_REASON_CODES:
-            failures.append(f"Reason code not enum: {code}")
+    _tally_reason_codes(rec_codes, summary["reason_code_counts"], failures)
 
     # TEST 5: Template blocked by low OCR confidence (forced low-conf provider)
-    import pipeline.ocr as ocr_module
-    import pipeline.document_analysis as da_module
-    original_get_provider = ocr_module.get_ocr_provider
-    da_original_get = da_module.get_ocr_provider
-    try:
-        ocr_module.get_ocr_provider = lambda name="stub": LowConfProvider()
-        da_module.get_ocr_provider = lambda name="stub": LowConfProvider()
+    # Scope the override to document analysis; run_chunk_pipeline keeps the regular stub provider.
+    with override_provider(LowConfProvider()):
         low_conf_analysis = analyze_document(str(low_conf_template_path), ocr_provider_name="stub")
-        summary["total_ocr_pages"] += low_conf_analysis.page_count
-        if low_conf_analysis.structure == "template":
-            failures.append("Low-confidence template classified as template.")
-        if not low_conf_analysis.low_confidence_for_template:
-            failures.append("low_confidence_for_template flag not set.")
-        rec, _ = run_chunk_pipeline(
-            0,
-            low_conf_template_path,
-            "lowconf_parent",
-            low_conf_template_path.name,
-            low_conf_analysis.format,
-            low_conf_analysis.structure == "template",
-            "stub",
-            template_blocked_low_conf=low_conf_analysis.low_confidence_for_template,
-            doc_class=low_conf_analysis.doc_class,
-            analysis_structure=low_conf_analysis.structure,
-            analysis_form_layout=low_conf_analysis.form_layout,
-            analysis_header_signature_score_max=max(
-                (p.header_signature_score for p in low_conf_analysis.pages), default=0.0
-            ),
-        )
-        if "OCR_LOW_CONFIDENCE" not in rec.review_reason_codes:
-            failures.append("Low-confidence template missing OCR_LOW_CONFIDENCE code.")
-        else:
-            summary["ocr_low_confidence_docs"] += 1
-            summary["template_blocked_low_conf_count"] += 1
-        for code in _normalize_reason_codes(rec.review_reason_codes):
-            summary["reason_code_counts"][code] = summary["reason_code_counts"].get(code, 0) + 1
-            if "=" in code or code not in ALLOWED_REASON_CODES:
-                failures.append(f"Reason code not enum: {code}")
-    finally:
-        ocr_module.get_ocr_provider = original_get_provider
-        da_module.get_ocr_provider = da_original_get
+    summary["total_ocr_pages"] += low_conf_analysis.page_count
+    if low_conf_analysis.structure == "template":
+        failures.append("Low-confidence template classified as template.")
+    if not low_conf_analysis.low_confidence_for_template:
+        failures.append("low_confidence_for_template flag not set.")
+    rec, _ = run_chunk_pipeline(
+        0,
+        low_conf_template_path,
+        "lowconf_parent",
+        low_conf_template_path.name,
+        low_conf_analysis.format,
+        low_conf_analysis.structure == "template",
+        "stub",
+        template_blocked_low_conf=low_conf_analysis.low_confidence_for_template,
+        doc_class=low_conf_analysis.doc_class,
+        analysis_structure=low_conf_analysis.structure,
+        analysis_form_layout=low_conf_analysis.form_layout,
+        analysis_header_signature_score_max=low_conf_analysis.header_signature_score_max,
+    )
+    rec_codes = _normalize_reason_codes(rec.review_reason_codes)
+    if "OCR_LOW_CONFIDENCE" not in rec_codes:
+        failures.append("Low-confidence template missing OCR_LOW_CONFIDENCE code.")
+    else:
+        summary["ocr_low_confidence_docs"] += 1
+        summary["template_blocked_low_conf_count"] += 1
+    _tally_reason_codes(rec_codes, summary["reason_code_counts"], failures)
 
     # Write summary artifact
     if summary["total_docs"] > 0:
         summary["avg_pages_per_doc"] = summary["total_ocr_pages"] / summary["total_docs"]
 
     summary_path = tmpdir / "batch_summary.json"
-    with open(summary_path, "w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2)
+    _write_json(summary_path, summary)
 
     print(f"Summary written to {summary_path}")
     if failures:
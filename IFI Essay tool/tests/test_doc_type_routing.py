@@ -17,3 +17,16 @@ def test_doc_type_routing_detects_acroform_typed_form():
         has_acroform=has_acroform,
     )
     assert doc_type == "ifi_typed_form_submission"
+
+
+def test_detect_acroform_accepts_open_document_and_leaves_it_open():
+    import fitz
+
+    repo_root = Path(__file__).resolve().parent.parent
+    fixture = repo_root / "docs" / "typed-form-submission" / "tc01_standard_form_26-IFI-filled.pdf"
+    doc = fitz.open(fixture)
+    try:
+        assert detect_pdf_has_acroform_fields(doc) is True
+        assert not doc.is_closed
+    finally:
+        doc.close()
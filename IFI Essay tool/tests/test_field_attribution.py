@@ -5,7 +5,9 @@ from pathlib import Path
 from pipeline.field_attribution import (
     assert_expected_attribution,
     build_field_attribution_debug_payload,
+    compute_field_attribution_confidence,
     compute_field_source_pages,
+    field_source_pages_from_attribution,
 )
 from pipeline.runner import _extract_header_fields_from_text
 from pipeline.validate import validate_record
@@ -94,6 +96,18 @@ def test_typed_form_start_page_attribution_has_no_mismatches():
     assert telemetry["attribution_missing"] == []
 
 
+def test_field_source_pages_from_attribution_matches_compute_field_source_pages():
+    per_page_text = [
+        {"page_index": 0, "text": "Essay intro"},
+        {"page_index": 1, "text": "Student Name: Ana Perez\nGrade: 8"},
+    ]
+    extracted_fields = {"student_name": "Ana Perez", "school_name": "Nowhere Academy", "grade": 8}
+    attribution = compute_field_attribution_confidence(per_page_text, extracted_fields, 0, 1)
+    source_pages = field_source_pages_from_attribution(attribution)
+    assert source_pages == compute_field_source_pages(per_page_text, extracted_fields, 0, 1)
+    assert source_pages == {"student_name": 1, "school_name": None, "grade": 1}
+
+
 def test_missing_attribution_builds_debug_payload():
     per_page_text = [
         {"page_index": 0, "text": "This page has no student name value"},
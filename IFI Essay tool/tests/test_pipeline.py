@@ -95,6 +95,16 @@ class TestGetOcrProvider:
         with pytest.raises(ValueError, match="Unknown OCR provider"):
             get_ocr_provider("nonexistent")
 
+    def test_override_provider_is_scoped(self):
+        from pipeline.ocr import get_ocr_provider, override_provider, StubOcrProvider
+        import pipeline.document_analysis as da_module
+        fake = object()
+        with override_provider(fake):
+            assert get_ocr_provider("google") is fake
+            # Modules that imported the factory by name see the override too.
+            assert da_module.get_ocr_provider("stub") is fake
+        assert isinstance(get_ocr_provider("stub"), StubOcrProvider)
+
 
 # ---------------------------------------------------------------------------
 # 2. Segmentation Tests
@@ -1,5 +1,8 @@
 import fitz
 import json
+import os
+import threading
+import time
 
 from pipeline.ocr import ocr_pdf_pages
 from pipeline.schema import OcrResult
@@ -7,6 +10,7 @@ from scripts.regression_check import (
     apply_doc_review_metrics,
     aggregate_parent_status_from_children,
     build_chunk_submission_id,
+    chunk_paths,
     compute_doc_reason_codes,
     enforce_attribution_thresholds,
     extract_doc_fields_from_final_text,
@@ -60,6 +64,93 @@ def test_ocr_pdf_pages_preserves_page_index_and_distinct_text(tmp_path):
     assert len({id(row) for row in stats}) == 3
 
 
+class PathEchoOcrProvider:
+    supports_concurrent_pages = True
+
+    def process_image(self, image_path: str) -> OcrResult:
+        page = fitz.open(image_path)
+        text = f"SIZE_{page[0].rect.height:.0f}"
+        page.close()
+        return OcrResult(
+            text=text,
+            confidence_avg=0.9,
+            confidence_min=0.9,
+            confidence_p10=0.9,
+            low_conf_page_count=0,
+            lines=[text],
+        )
+
+
+def test_ocr_pdf_pages_concurrent_provider_keeps_page_order(tmp_path):
+    pdf_path = tmp_path / "sized_pages.pdf"
+    doc = fitz.open()
+    heights = [200, 300, 400, 500, 600]
+    for h in heights:
+        doc.new_page(width=100, height=h)
+    doc.save(pdf_path)
+    doc.close()
+
+    stats, total = ocr_pdf_pages(str(pdf_path), provider=PathEchoOcrProvider(), include_text=True)
+
+    assert total == len(heights)
+    assert [row["page_index"] for row in stats] == list(range(len(heights)))
+    # Each page image records its own dpi, so it reopens at the source page height.
+    assert [row["text"] for row in stats] == [f"SIZE_{h}" for h in heights]
+
+
+class LivePngCountingProvider:
+    """Concurrent provider that records how many rendered page PNGs exist on disk per call."""
+
+    supports_concurrent_pages = True
+
+    def __init__(self):
+        self.paths = []
+        self.live_counts = []
+        self._lock = threading.Lock()
+
+    def process_image(self, image_path: str) -> OcrResult:
+        with self._lock:
+            self.paths.append(image_path)
+            self.live_counts.append(sum(os.path.exists(p) for p in self.paths))
+        time.sleep(0.01)
+        return OcrResult(text="x", confidence_avg=0.9, lines=["x"])
+
+
+def test_ocr_pdf_pages_concurrent_provider_bounds_pages_on_disk(tmp_path):
+    from pipeline.ocr import OCR_PAGE_WORKERS
+
+    pdf_path = tmp_path / "many_pages.pdf"
+    _make_pdf(pdf_path, pages=12)
+    provider = LivePngCountingProvider()
+
+    stats, total = ocr_pdf_pages(str(pdf_path), provider=provider)
+
+    assert total == 12
+    assert [row["page_index"] for row in stats] == list(range(12))
+    assert max(provider.live_counts) <= OCR_PAGE_WORKERS
+    assert not any(os.path.exists(p) for p in provider.paths)
+
+
+def test_chunk_paths_accepts_open_document_and_leaves_it_open(tmp_path):
+    from pipeline.document_analysis import ChunkRange
+
+    pdf_path = tmp_path / "bundle.pdf"
+    _make_pdf(pdf_path, pages=3)
+    chunks = [ChunkRange(start_page=0, end_page=1), ChunkRange(start_page=2, end_page=2)]
+
+    with fitz.open(pdf_path) as doc:
+        out = chunk_paths(doc, chunks, tmp_path)
+        assert not doc.is_closed
+    from_path = chunk_paths(pdf_path, chunks, tmp_path)
+
+    assert [idx for idx, _ in out] == [0, 1] == [idx for idx, _ in from_path]
+    page_counts = []
+    for _, path in out:
+        with fitz.open(path) as chunk_doc:
+            page_counts.append(chunk_doc.page_count)
+    assert page_counts == [2, 1]
+
+
 def test_doc_level_aggregate_extraction_avoids_missing_flags():
     final_text = """Some intro line
 School Name: Lincoln Middle School
@@ -168,6 +259,7 @@ def test_enforce_attribution_thresholds_fails_below_required_rate(tmp_path):
     failures = enforce_attribution_thresholds(counts, tmp_path)
     assert len(failures) >= 1
     assert any("ifi_typed_form_submission" in msg for msg in failures)
+    assert all("doc_summary.json" in msg and "--emit-attribution-artifacts" in msg for msg in failures)
 
 
 def test_write_field_attribution_debug_artifact_for_missing_source(tmp_path):
@@ -9,7 +9,7 @@ import os
 import tempfile
 from pathlib import Path
 from pipeline.database import (
-    init_database, save_record, get_records, get_record_by_id,
+    init_database, save_record, save_records_bulk, get_records, get_record_by_id,
     update_record, delete_record, get_stats
 )
 from pipeline.schema import SubmissionRecord
@@ -63,6 +63,34 @@ class TestUserScoping:
         assert records[0]["submission_id"] == "test001"
         assert records[0]["owner_user_id"] == user_id_1
     
+    def test_save_records_bulk_with_owner_user_id(self, temp_db):
+        """Bulk save should write every record in one call with owner_user_id."""
+        user_id_1 = "user-123"
+        
+        pairs = [
+            (
+                SubmissionRecord(
+                    submission_id=f"test00{i}",
+                    student_name=f"Student {i}",
+                    school_name="Lincoln Elementary",
+                    grade=5,
+                    word_count=100,
+                    needs_review=True,
+                    review_reason_codes="MISSING_GRADE",
+                    artifact_dir=f"artifacts/test00{i}"
+                ),
+                f"test{i}.pdf",
+            )
+            for i in range(1, 4)
+        ]
+        
+        assert save_records_bulk(pairs, owner_user_id=user_id_1) == 3
+        
+        records = get_records(owner_user_id=user_id_1)
+        assert sorted(r["submission_id"] for r in records) == ["test001", "test002", "test003"]
+        assert {r["filename"] for r in records} == {"test1.pdf", "test2.pdf", "test3.pdf"}
+        assert save_records_bulk([]) == 0
+    
     def test_get_records_filters_by_owner(self, temp_db):
         """get_records should only return records for the specified owner."""
         user_id_1 = "user-123"